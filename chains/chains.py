@@ -1,4 +1,4 @@
-from clients.llm_factory import LLMClient
+from clients.llm_factory import LLMClient, close_llm_clients
 from langchain_core.runnables import Runnable
 from langchain_core.prompts import PromptTemplate
 from config.settings import AppSettings, ConfigLoader
@@ -33,3 +33,7 @@ class Chains:
             PromptTemplate.from_template(config_loader.get_reduce_prompt_template())
             | self.llm_client
         )
+
+    def close(self) -> None:
+        """Close the shared LLM connections used by these chains."""
+        close_llm_clients()
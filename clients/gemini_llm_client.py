@@ -1,4 +1,5 @@
-from typing import Any, Dict, Optional, Union
+import threading
+from typing import Any, Dict, Optional, Tuple, Union
 from utils.logging_config import log_prompt
 from langchain_core.runnables import Runnable
 from config.settings import APISettings
@@ -33,8 +34,24 @@ class GeminiLLMClient(Runnable):
         return result.content if hasattr(result, "content") else str(result)
 
 
-def _create_gemini_llm(api_settings: APISettings):
-    """Create Gemini LLM client with lazy import to avoid dependency issues."""
+# Shared Gemini chat models keyed by (model, api_key, temperature) so every
+# chain reuses the same underlying transport instead of opening a new one.
+_GEMINI_LLMS: Dict[Tuple[str, str, float], Any] = {}
+_gemini_lock = threading.Lock()
+
+
+def get_shared_gemini_llm(api_settings: APISettings):
+    """Get or create the shared ChatGoogleGenerativeAI for the configured model."""
+    # Deterministic unless a temperature is configured
+    temperature = (
+        0.0 if api_settings.llm_temperature is None else api_settings.llm_temperature
+    )
+    key = (api_settings.gemini_model, api_settings.google_api_key, temperature)
+    # Lock-free fast path once the model exists; lock only to create it
+    llm = _GEMINI_LLMS.get(key)
+    if llm is not None:
+        return llm
+
     try:
         from langchain_google_genai import ChatGoogleGenerativeAI
     except ImportError:
@@ -42,13 +59,25 @@ def _create_gemini_llm(api_settings: APISettings):
             "langchain-google-genai package is required for Gemini provider. "
             "Install it with: pip install langchain-google-genai"
         )
-    return GeminiLLMClient(
-        ChatGoogleGenerativeAI(
-            model=api_settings.gemini_model,
-            google_api_key=api_settings.google_api_key,
-            temperature=0.0,
-        )
-    )
+    with _gemini_lock:
+        if key not in _GEMINI_LLMS:
+            _GEMINI_LLMS[key] = ChatGoogleGenerativeAI(
+                model=api_settings.gemini_model,
+                google_api_key=api_settings.google_api_key,
+                temperature=temperature,
+            )
+        return _GEMINI_LLMS[key]
+
+
+def close_gemini_llm_clients() -> None:
+    """Drop the shared Gemini chat models so their transports can be released."""
+    with _gemini_lock:
+        _GEMINI_LLMS.clear()
+
+
+def _create_gemini_llm(api_settings: APISettings):
+    """Create Gemini LLM client with lazy import to avoid dependency issues."""
+    return GeminiLLMClient(get_shared_gemini_llm(api_settings))
 
 
 class LazyGeminiLLM(Runnable):
@@ -52,6 +52,22 @@ def get_llm(api_settings: APISettings) -> Runnable:
         )
 
 
+def close_llm_clients() -> None:
+    """Release the shared connections held by all LLM provider clients."""
+    from clients.local_llm_client import close_local_llm_clients
+    from clients.gemini_llm_client import close_gemini_llm_clients
+
+    close_local_llm_clients()
+    close_gemini_llm_clients()
+
+
+async def aclose_llm_connections() -> None:
+    """Release the pooled async connections opened on the running event loop."""
+    from clients.local_llm_client import aclose_local_llm_connections
+
+    await aclose_local_llm_connections()
+
+
 class LLMClient(Runnable):
     """Lazy wrapper for LLM client that initializes only when first accessed."""
 
@@ -76,6 +92,13 @@ class LLMClient(Runnable):
         )
         return rate_limited_invoke(*args, **kwargs)
 
+    async def ainvoke(self, *args, **kwargs):
+        # Throttle without blocking the event loop while waiting for a token
+        rate_limited_ainvoke = self.rate_limiter.check_rate_limit_async(
+            self._get_client().ainvoke
+        )
+        return await rate_limited_ainvoke(*args, **kwargs)
+
     def __getattr__(self, name):
         # Delegate all other attributes to the actual client
         return getattr(self._get_client(), name)
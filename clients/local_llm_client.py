@@ -1,4 +1,7 @@
-from typing import Any, Dict, Optional, Union
+import asyncio
+import threading
+import httpx
+from typing import Any, Dict, Optional, Set, Tuple, Union
 from utils.logging_config import log_prompt
 from langchain_ollama import OllamaLLM
 from langchain_core.runnables import Runnable
@@ -35,10 +38,101 @@ class LLMClient(Runnable):
         return result
 
 
+# Connection pools behind every shared Ollama client: a sync and an async
+# transport, created with the first client. They are owned here rather than
+# by the ollama clients, so they can be closed without reaching into them.
+HttpTransports = Tuple[httpx.HTTPTransport, httpx.AsyncHTTPTransport]
+_HTTP_TRANSPORTS: Optional[HttpTransports] = None
+
+# Shared Ollama clients keyed by (model, base_url, temperature), so every
+# chain sends its requests through the same pooled transports.
+_OLLAMA_LLMS: Dict[Tuple[str, str, Optional[float]], OllamaLLM] = {}
+_ollama_lock = threading.Lock()
+
+# Pending closes of async transports scheduled on a running event loop; the
+# loop only keeps weak references to its tasks
+_CLOSING_TASKS: Set["asyncio.Task[None]"] = set()
+
+
+def _get_http_transports(api_settings: APISettings) -> HttpTransports:
+    """Get or create the shared transports; the caller holds _ollama_lock."""
+    global _HTTP_TRANSPORTS
+    if _HTTP_TRANSPORTS is None:
+        limits = httpx.Limits(
+            max_keepalive_connections=api_settings.max_concurrency,
+            keepalive_expiry=60,
+        )
+        _HTTP_TRANSPORTS = (
+            httpx.HTTPTransport(limits=limits),
+            httpx.AsyncHTTPTransport(limits=limits),
+        )
+    return _HTTP_TRANSPORTS
+
+
+def _get_shared_ollama_llm(api_settings: APISettings) -> OllamaLLM:
+    """Get or create the shared OllamaLLM for the configured model and server."""
+    llm_base_url = api_settings.llm_api_url.replace("/api/generate", "")
+    key = (api_settings.llm_model, llm_base_url, api_settings.llm_temperature)
+    # Lock-free fast path once the client exists; lock only to create it
+    llm = _OLLAMA_LLMS.get(key)
+    if llm is not None:
+        return llm
+    with _ollama_lock:
+        if key not in _OLLAMA_LLMS:
+            sync_transport, async_transport = _get_http_transports(api_settings)
+            _OLLAMA_LLMS[key] = OllamaLLM(
+                model=api_settings.llm_model,
+                base_url=llm_base_url,
+                temperature=api_settings.llm_temperature,
+                sync_client_kwargs={"transport": sync_transport},
+                async_client_kwargs={"transport": async_transport},
+            )
+        return _OLLAMA_LLMS[key]
+
+
+async def aclose_local_llm_connections() -> None:
+    """
+    Close the pooled async connections opened on the running event loop.
+
+    Async connections are bound to the loop that opened them and cannot be
+    reused from the next one, so they are closed before that loop ends. The
+    transport itself stays usable.
+    """
+    transports = _HTTP_TRANSPORTS
+    if transports is not None:
+        await transports[1].aclose()
+
+
+def close_local_llm_clients() -> None:
+    """
+    Close the shared Ollama connection pools and drop the clients.
+
+    Safe to call from inside a running event loop: the async pool cannot be
+    closed there with asyncio.run, so its close is scheduled on that loop
+    instead. The next client gets freshly created transports either way.
+    """
+    global _HTTP_TRANSPORTS
+    with _ollama_lock:
+        _OLLAMA_LLMS.clear()
+        transports, _HTTP_TRANSPORTS = _HTTP_TRANSPORTS, None
+    if transports is None:
+        return
+
+    sync_transport, async_transport = transports
+    sync_transport.close()
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        asyncio.run(async_transport.aclose())
+    else:
+        task = loop.create_task(async_transport.aclose())
+        _CLOSING_TASKS.add(task)
+        task.add_done_callback(_CLOSING_TASKS.discard)
+
+
 def _create_local_llm(api_settings: APISettings):
     """Create local LLM client with current settings."""
-    llm_base_url = api_settings.llm_api_url.replace("/api/generate", "")
-    return LLMClient(OllamaLLM(model=api_settings.llm_model, base_url=llm_base_url))
+    return LLMClient(_get_shared_ollama_llm(api_settings))
 
 
 class LazyLocalLLM:
@@ -4,12 +4,13 @@ Centralized settings management file.
 
 import os
 import json
+import orjson
 from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from urllib.parse import urlparse
 
-from pydantic import Field, field_validator, model_validator
+from pydantic import Field, PrivateAttr, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from dotenv import load_dotenv
 
@@ -46,6 +47,8 @@ class APISettings(BaseSettings):
         default="http://localhost:11434/api/generate", alias="LLM_API_URL"
     )
     llm_model: str = Field(default="mistral", alias="LLM_MODEL")
+    # Sampling temperature; None keeps each provider's default
+    llm_temperature: Optional[float] = Field(default=None, alias="LLM_TEMPERATURE")
     # Google Gemini API
     google_api_key: str = Field(default="", alias="GOOGLE_API_KEY")
     gemini_model: str = Field(default="gemini-2.5-pro", alias="GEMINI_MODEL")
@@ -66,6 +69,9 @@ class APISettings(BaseSettings):
     chunk_size: int = Field(
         default=40000, alias="CHUNK_SIZE"
     )  # Target chunk size in tokens
+    max_concurrency: int = Field(
+        default=4, alias="MAX_CONCURRENCY"
+    )  # Max concurrent/keep-alive LLM connections
 
     # Data Sources Configuration
     sources: List[str] = Field(default=["JIRA", "GITHUB"], alias="SOURCES")
@@ -251,6 +257,7 @@ class FilePathSettings:
         self._data_dir = data_dir
         self._config_dir = config_dir
         self._config_files = config_files
+        self._urls_file_paths: Dict[str, Path] = {}
 
     @property
     def data_dir(self) -> Path:
@@ -318,6 +325,11 @@ class FilePathSettings:
         """Get full path to project_result_cache.pkl file."""
         return self._data_dir / "project_result_cache.pkl"
 
+    @property
+    def summary_cache_file_path(self) -> Path:
+        """Get full path to summary_cache.pkl file."""
+        return self._data_dir / "summary_cache.pkl"
+
     @property
     def summarized_features_file_path(self) -> Path:
         """Get full path to summarized_features.json file."""
@@ -388,7 +400,11 @@ class FilePathSettings:
 
     def get_urls_file_path(self, source: str) -> Path:
         """Get full path to source-specific URLs file (e.g., github_urls.txt)."""
-        return self._data_dir / f"{source.lower()}_urls.txt"
+        path = self._urls_file_paths.get(source)
+        if path is None:
+            path = self._data_dir / f"{source.lower()}_urls.txt"
+            self._urls_file_paths[source] = path
+        return path
 
 
 class AppSettings(BaseSettings):
@@ -410,14 +426,30 @@ class AppSettings(BaseSettings):
     security: SecuritySettings = Field(default_factory=SecuritySettings)
     config_files: ConfigFileSettings = Field(default_factory=ConfigFileSettings)
 
+    _file_paths: Optional[FilePathSettings] = PrivateAttr(default=None)
+
     @property
     def file_paths(self) -> FilePathSettings:
-        """Get computed file paths."""
-        return FilePathSettings(
-            data_dir=self.directories.data_dir,
-            config_dir=self.directories.config_dir,
-            config_files=self.config_files,
-        )
+        """
+        Get computed file paths.
+
+        The instance is reused until data_dir, config_dir or config_files
+        is replaced, so tests that monkeypatch a directory still see it.
+        """
+        file_paths = self._file_paths
+        if (
+            file_paths is None
+            or file_paths._data_dir is not self.directories.data_dir
+            or file_paths._config_dir is not self.directories.config_dir
+            or file_paths._config_files is not self.config_files
+        ):
+            file_paths = FilePathSettings(
+                data_dir=self.directories.data_dir,
+                config_dir=self.directories.config_dir,
+                config_files=self.config_files,
+            )
+            self._file_paths = file_paths
+        return file_paths
 
     @property
     def source_server_map(self) -> Dict[str, str]:
@@ -447,13 +479,11 @@ class ConfigLoader:
         """Load and cache JSON configuration file."""
         file_path = self.settings.directories.config_dir / filename
 
-        if not file_path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {file_path}")
-
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except json.JSONDecodeError as e:
+            return orjson.loads(file_path.read_bytes())
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {file_path}")
+        except orjson.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in {file_path}: {e}")
 
     @lru_cache(maxsize=32)
@@ -461,12 +491,11 @@ class ConfigLoader:
         """Load and cache text configuration file."""
         file_path = self.settings.directories.config_dir / filename
 
-        if not file_path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {file_path}")
-
         try:
             with open(file_path, "r", encoding="utf-8") as f:
                 return f.read()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {file_path}")
         except UnicodeDecodeError as e:
             raise ValueError(f"Cannot decode {file_path}: {e}")
 
@@ -6,7 +6,7 @@ from summarizers.summarizer import Summarizer
 from scrapers.jira_scraper import extract_jira_ids
 from filters.filter_enabled_feature_gates import filter_enabled_feature_gates
 from config.settings import AppSettings, FilePathSettings
-from utils.file_utils import write_pickle_file, read_pickle_file
+from utils.file_utils import write_pickle_file, read_pickle_file, read_json_file
 
 logger = get_logger(__name__)
 
@@ -22,8 +22,7 @@ def build_github_item_index(github_file_path: str):
         Dictionary mapping JIRA issue IDs to lists of related GitHub items.
     """
     index = {}
-    with open(github_file_path, "r") as srcfile:
-        github = json.load(srcfile)
+    github = read_json_file(github_file_path)
 
     for item in github:
         title = item.get("title", "")
@@ -66,8 +65,7 @@ class Correlator:
         sources = self.sources
 
         # Load the JIRA hierarchy structure
-        with open(file_path_settings.jira_json_file_path, "r") as jira_file:
-            jira = json.load(jira_file)
+        jira = read_json_file(file_path_settings.jira_json_file_path)
 
         non_correlated = []
 
@@ -141,21 +139,11 @@ class Correlator:
         )
 
         # Load the correlated JIRA/GitHub data
-        with open(file_path_settings.correlated_file_path, "r") as f:
-            correlated = json.load(f)
+        correlated = read_json_file(file_path_settings.correlated_file_path)
 
         feature_gate_artifacts = {}
         feature_gate_project_map = defaultdict(str)
 
-        def match_feature_gate(feature_gate: str, value: str):
-            """
-            Check if a feature gate is mentioned in a text value.
-
-            Uses case-insensitive substring matching to find feature gate
-            references in various text fields.
-            """
-            return isinstance(value, str) and feature_gate.lower() in value.lower()
-
         def update_feature_gate_artifacts(feature_gate, artifact, project_name):
             """
             Helper to add feature gate matches to results.
@@ -172,47 +160,53 @@ class Correlator:
             epic_key = artifact.get("epic_key", "")
             return f"{summary}|{epic_key}"
 
+        def get_searchable_text(artifact):
+            """
+            Lower-case and join every string an artifact can match on.
+
+            Covers direct JIRA artifact fields and the fields of GitHub items
+            attached to JIRA issues.
+            """
+            texts = []
+            for artifact_value in artifact.values():
+                if isinstance(artifact_value, list):
+                    for src_dict in artifact_value:
+                        if isinstance(src_dict, dict):
+                            texts.extend(
+                                v for v in src_dict.values() if isinstance(v, str)
+                            )
+                elif isinstance(artifact_value, str):
+                    texts.append(artifact_value)
+            return "\0".join(texts).lower()
+
+        # Index every artifact once so each feature gate is a plain substring
+        # scan instead of re-walking and re-lowercasing the correlated data
+        indexed_artifacts = [
+            (
+                project_name,
+                artifact,
+                get_artifact_key(artifact),
+                get_searchable_text(artifact),
+            )
+            for project_name, project in correlated.items()
+            for jira_artifact in project.values()
+            if isinstance(jira_artifact, dict)  # Skip summary, description fields
+            for artifact in jira_artifact.values()
+        ]
+
         for feature_gate in feature_gates:
+            feature_gate_lower = feature_gate.lower()
             # Track which artifact we've already added for this feature gate to prevent duplicates
             added_artifacts = set()
 
-            for project_name, project in correlated.items():
-                for jira_artifact in project.values():
-                    if not isinstance(jira_artifact, dict):
-                        # Skip summary, description fields
-                        continue
-                    for artifact in jira_artifact.values():
-                        artifact_key = get_artifact_key(artifact)
-                        if artifact_key and artifact_key in added_artifacts:
-                            continue
+            for project_name, artifact, artifact_key, text in indexed_artifacts:
+                if artifact_key and artifact_key in added_artifacts:
+                    continue
 
-                        # Search for feature gate mentions in any field of the artifact
-                        artifact_matches = False
-                        for artifact_value in artifact.values():
-                            if isinstance(artifact_value, list):
-                                # Handle GitHub items attached to JIRA issues
-                                for src_dict in artifact_value:
-                                    if not isinstance(src_dict, dict):
-                                        continue
-                                    for src_value in src_dict.values():
-                                        if match_feature_gate(feature_gate, src_value):
-                                            artifact_matches = True
-                                            break
-                                    if artifact_matches:
-                                        break
-                            else:
-                                # Handle direct JIRA artifact fields
-                                if match_feature_gate(feature_gate, artifact_value):
-                                    artifact_matches = True
-                                    break
-                            if artifact_matches:
-                                break
-
-                        if artifact_matches:
-                            update_feature_gate_artifacts(
-                                feature_gate, artifact, project_name
-                            )
-                            added_artifacts.add(artifact_key)
+                # Search for feature gate mentions in any field of the artifact
+                if feature_gate_lower in text:
+                    update_feature_gate_artifacts(feature_gate, artifact, project_name)
+                    added_artifacts.add(artifact_key)
 
         # Identify feature gates that weren't found in correlated data
         matched_feature_gates = set(feature_gate_artifacts.keys())
@@ -226,23 +220,30 @@ class Correlator:
             )
             sources = [s for s in sources if s != "JIRA"]
 
-            for fg in unmatched_feature_gates:
-                for src in sources:
-                    src = src.lower()
-                    # Read the JSON data file for this source
-                    json_file_path = getattr(
-                        file_path_settings, f"{src}_json_file_path"
-                    )
-                    with open(json_file_path) as f:
-                        src_data = json.load(f)
-                    if isinstance(src_data, list):
-                        for data in src_data:
-                            if isinstance(data, dict):
-                                for value in data.values():
-                                    if match_feature_gate(fg, value):
-                                        update_feature_gate_artifacts(
-                                            fg, data, "NO-PROJECT"
-                                        )
+            # Read each source's JSON data file once, not once per feature gate
+            src_data_list = []
+            for src in sources:
+                json_file_path = getattr(
+                    file_path_settings, f"{src.lower()}_json_file_path"
+                )
+                src_data_list.append(read_json_file(json_file_path))
+
+            # Case-insensitive substring match: lower-case every gate once and
+            # every source value once, rather than both on each comparison
+            unmatched_lower = [(fg, fg.lower()) for fg in unmatched_feature_gates]
+            for src_data in src_data_list:
+                if not isinstance(src_data, list):
+                    continue
+                for data in src_data:
+                    if not isinstance(data, dict):
+                        continue
+                    for value in data.values():
+                        if not isinstance(value, str):
+                            continue
+                        value_lower = value.lower()
+                        for fg, fg_lower in unmatched_lower:
+                            if fg_lower in value_lower:
+                                update_feature_gate_artifacts(fg, data, "NO-PROJECT")
 
         if unmatched_feature_gates:
             match_other_sources(unmatched_feature_gates, sources)
@@ -269,12 +270,10 @@ class Correlator:
 
     def correlate_features(self):
         logger.info("[*] Correlating features with JIRA/GitHub data")
-        with open(
-            self.file_path_settings.correlated_feature_gate_table_file_path, "r"
-        ) as f:
-            correlated_feature_gate_table = json.load(f)
-        with open(self.file_path_settings.correlated_file_path, "r") as f:
-            correlated = json.load(f)
+        correlated_feature_gate_table = read_json_file(
+            self.file_path_settings.correlated_feature_gate_table_file_path
+        )
+        correlated = read_json_file(self.file_path_settings.correlated_file_path)
         feature_gate_project_map = read_pickle_file(
             self.file_path_settings.feature_gate_project_map_file_path
         )
@@ -295,10 +294,10 @@ class Correlator:
 
     def correlate_summarized_features(self):
         logger.info("[*] Correlating summarized features with JIRA/GitHub data")
-        with open(self.file_path_settings.summarized_features_file_path, "r") as f:
-            summarized_features = json.load(f)
-        with open(self.file_path_settings.correlated_file_path, "r") as f:
-            correlated = json.load(f)
+        summarized_features = read_json_file(
+            self.file_path_settings.summarized_features_file_path
+        )
+        correlated = read_json_file(self.file_path_settings.correlated_file_path)
         feature_gate_project_map = read_pickle_file(
             self.file_path_settings.feature_gate_project_map_file_path
         )
@@ -2,7 +2,7 @@ from utils.parser_utils import clean_md_text
 from dataclasses import dataclass, asdict
 
 
-@dataclass
+@dataclass(slots=True)
 class GithubModel:
     """
     Standardized data model for GitHub items (PRs and commits).
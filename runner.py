@@ -2,6 +2,7 @@ from os import makedirs
 from scrapers.scrapers import Scraper
 from correlators.correlator import Correlator
 from summarizers.summarizer import Summarizer
+from clients.llm_factory import close_llm_clients
 from config.settings import get_settings
 from utils.logging_config import get_logger, setup_logging
 
@@ -32,14 +33,22 @@ def run(kwargs: dict) -> None:
     """
     settings = get_settings()
     makedirs(settings.directories.data_dir, exist_ok=True)
-    # Scrape the data from the sources
-    scraper = Scraper(kwargs, settings)
-    scraper.scrape()
-
-    # Correlates the data across sources using JIRA IDs
-    correlator = Correlator(settings)
-    correlator.correlate()
-
-    # Summarize the correlated data using dependency injection
-    summarizer = Summarizer(settings)
-    summarizer.summarize()
+    try:
+        # Scrape the data from the sources
+        scraper = Scraper(kwargs, settings)
+        scraper.scrape()
+
+        # Correlates the data across sources using JIRA IDs
+        correlator = Correlator(settings)
+        correlator.correlate()
+
+        # Summarize the correlated data using dependency injection
+        summarizer = Summarizer(settings)
+        summarizer.summarize()
+    finally:
+        # Close the pooled LLM connections shared by every chain; a failure
+        # here is logged so it cannot hide an error raised by the pipeline
+        try:
+            close_llm_clients()
+        except Exception as e:
+            logger.error(f"Failed to close LLM clients: {e}")
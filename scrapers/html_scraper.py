@@ -4,7 +4,7 @@ from typing import Set, List, cast
 from bs4 import BeautifulSoup, Tag
 from utils.parser_utils import parse_tables
 from utils.utils import is_valid_url, contains_valid_keywords
-from utils.parser_utils import parse_html
+from utils.parser_utils import load_html, parse_html_text
 from utils.logging_config import get_logger
 from config.settings import AppSettings, ConfigFileSettings, ConfigLoader
 
@@ -39,15 +39,17 @@ class HtmlScraper:
         """
         logger.info(f"Scraping {self.url}...")
         logger.info(f"Parsing HTML...")
-        # Parse the HTML content (handles both local files and web URLs)
-        html: BeautifulSoup = parse_html(self.url)
+        # Load the HTML content (handles both local files and web URLs)
+        page: str = load_html(self.url)
+        html: BeautifulSoup = parse_html_text(page)
 
         # Extract and filter relevant URLs for downstream processing
         self.scrape_valid_urls(html, self.settings.file_paths.urls_file_path)
 
-        # Extract structured data from tables (primarily feature gates)
+        # Extract structured data from tables (primarily feature gates); the
+        # raw page is passed so it need not be serialized back from the soup
         self.scrape_table_info(
-            html, self.settings.file_paths.feature_gate_table_file_path
+            page, self.settings.file_paths.feature_gate_table_file_path
         )
 
     def scrape_valid_urls(self, soup: BeautifulSoup, urls_file_path: Path) -> None:
@@ -93,7 +95,7 @@ class HtmlScraper:
         logger.debug(f"Extracted {len(seen)} URL(s).")
 
     def scrape_table_info(
-        self, html: BeautifulSoup, feature_gate_table_file_path
+        self, html: str | BeautifulSoup, feature_gate_table_file_path
     ) -> None:
         """
         Extract structured data from HTML tables.
@@ -103,7 +105,7 @@ class HtmlScraper:
         them with development work.
 
         Args:
-            html: Parsed BeautifulSoup object of the HTML content
+            html: Raw HTML text, or a parsed BeautifulSoup object of it
 
         Output: Creates feature_gate_table.pkl with extracted table data
         """
@@ -1,3 +1,4 @@
+import re
 import json
 from typing import List, Any
 from itertools import islice
@@ -17,6 +18,25 @@ logger = get_logger(__name__)
 FEATURE_FILTER_ON = False
 KEYWORD_MATCHING_ON = False
 
+# Markdown header prefix per issue type, in rendering order.
+# Epics are primary (##), others are secondary (###); plural type names are
+# turned into singular titles once here rather than for every issue.
+ISSUE_TYPE_HEADERS = {
+    "epics": "## Epic",
+    "stories": "### Story",
+    **{
+        issue_type: f"### {issue_type.rstrip('s').title()}"
+        for issue_type in [
+            "bugs",
+            "features",
+            "enhancements",
+            "tasks",
+            "improvements",
+            "sub-tasks",
+        ]
+    },
+}
+
 
 class JiraScraper:
     """
@@ -651,18 +671,7 @@ def render_to_markdown(hierarchy):
         md += f"**Description**: {project_data.get('description', '')}\n\n"
 
         # Process all issue types dynamically to handle various JIRA configurations
-        issue_types = [
-            "epics",
-            "stories",
-            "bugs",
-            "features",
-            "enhancements",
-            "tasks",
-            "improvements",
-            "sub-tasks",
-        ]
-
-        for issue_type in issue_types:
+        for issue_type, header in ISSUE_TYPE_HEADERS.items():
             issues = project_data.get(issue_type, {})
             if not issues:
                 continue
@@ -674,20 +683,7 @@ def render_to_markdown(hierarchy):
                     )
                     continue
 
-                # Format headers based on issue type hierarchy
-                # Epics are primary (##), others are secondary (###)
-                if issue_type == "epics":
-                    md += f"## Epic: {issue_key} — {issue.get('summary', '')}\n"
-                elif issue_type == "stories":
-                    md += f"### Story: {issue_key} — {issue.get('summary', '')}\n"
-                else:
-                    # Handle plural to singular conversion for clean headers
-                    issue_type_singular = (
-                        issue_type.rstrip("s")
-                        if issue_type.endswith("s")
-                        else issue_type
-                    )
-                    md += f"### {issue_type_singular.title()}: {issue_key} — {issue.get('summary', '')}\n"
+                md += f"{header}: {issue_key} — {issue.get('summary', '')}\n"
 
                 md += f"**Description:**\n{issue.get('description', '')}\n\n"
 
@@ -707,7 +703,8 @@ def render_to_markdown(hierarchy):
     return md
 
 
-def extract_jira_ids(md):
-    import re
+_JIRA_ID_RE = re.compile(r"\b[A-Z][A-Z0-9]+-\d+\b")
 
-    return re.findall(r"\b[A-Z][A-Z0-9]+-\d+\b", md)
+
+def extract_jira_ids(md):
+    return _JIRA_ID_RE.findall(md)
@@ -57,18 +57,19 @@ class Scraper:
         urls_file_path = self.settings.file_paths.urls_file_path
         get_urls_file_path = self.settings.file_paths.get_urls_file_path
 
-        urls_dict = {}
-        servers = source_servers
+        # Lower-case source names once, outside the per-line loop
+        servers = [(src.lower(), server) for src, server in source_servers.items()]
+
+        # Insertion-ordered dicts give O(1) de-duplication while keeping file order
+        urls_by_src: dict[str, dict[str, None]] = {}
         with open(urls_file_path) as f:
-            for url in f:
-                url = url.strip()
-                for src, server in servers.items():
+            for line in f:
+                url = line.strip()
+                for src, server in servers:
                     if server in url:
-                        if src.lower() not in urls_dict:
-                            urls_dict[src.lower()] = []
-                        if url not in urls_dict[src.lower()]:
-                            urls_dict[src.lower()].append(url)
+                        urls_by_src.setdefault(src, {})[url] = None
 
+        urls_dict = {src: list(urls) for src, urls in urls_by_src.items()}
         for src, urls in urls_dict.items():
             with open(get_urls_file_path(src), "w") as f:
                 f.writelines(url + "\n" for url in urls)
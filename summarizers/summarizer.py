@@ -1,22 +1,59 @@
 import json
+import asyncio
+import hashlib
+import orjson
 from dataclasses import dataclass
-from typing import Any, List, Dict
+from functools import cached_property
+from typing import Any, List, Dict, Optional
 from langchain_core.documents import Document
+from langchain_core.prompts import BasePromptTemplate
 from langchain_text_splitters import (
     MarkdownHeaderTextSplitter,
     RecursiveCharacterTextSplitter,
     RecursiveJsonSplitter,
 )
-from utils.utils import convert_jira_ids_to_links, json_to_markdown
+from utils.utils import convert_jira_ids_to_links, json_to_markdown, run_async
 from chains.chains import Chains
+from clients.llm_factory import aclose_llm_connections
 from config.settings import get_config_loader, AppSettings
 from utils.logging_config import get_logger, setup_logging
 from utils.gemini_tokenizer import GeminiTokenizer
+from utils.file_utils import read_json_file, read_pickle_file, write_pickle_file
 
 logger = get_logger(__name__)
 
 
-@dataclass
+# Rough characters-per-token ratio for English text and markup
+CHARS_PER_TOKEN = 4
+
+# Upper bound on the encoded size of one character
+MAX_UTF8_BYTES_PER_CHAR = 4
+
+# Most chain outputs kept in the persistent summary cache; oldest are dropped
+SUMMARY_CACHE_MAX_ENTRIES = 4096
+
+
+def _to_json_bytes(value: Any) -> bytes:
+    """Serialize value to JSON, stringifying non-str keys like json.dumps."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap local token estimate, used where exact counts are not needed."""
+    return len(text) // CHARS_PER_TOKEN
+
+
+# Splits text on markdown headers; it holds no per-call state, so one is shared
+MARKDOWN_HEADER_SPLITTER = MarkdownHeaderTextSplitter(
+    headers_to_split_on=[
+        ("#", "header1"),
+        ("##", "header2"),
+        ("###", "header3"),
+    ]
+)
+
+
+@dataclass(slots=True)
 class ChunkMetadata:
     """Metadata for a text chunk"""
 
@@ -40,6 +77,33 @@ class MapReduceSummarizer:
         self.chunk_size = int(self.settings.api.max_input_tokens_per_request * 0.1)
         self.chunk_overlap = int(self.settings.api.chunk_overlap)
         self.reduce_enabled = self.settings.processing.reduce_enabled
+        self.max_concurrency = self.settings.api.max_concurrency
+
+        # Summary cache: chain outputs keyed by a hash of the model, prompt
+        # template and inputs, persisted so identical chunks are not re-sent
+        # on later runs. Dicts keep insertion order, so the oldest entries are
+        # first in line for eviction.
+        self.summary_cache_file_path = self.settings.file_paths.summary_cache_file_path
+        cached = read_pickle_file(self.summary_cache_file_path) or {}
+        self.summary_cache: Dict[str, Any] = dict(
+            list(cached.items())[-SUMMARY_CACHE_MAX_ENTRIES:]
+        )
+        self._summary_cache_dirty = False
+
+    @cached_property
+    def semantic_splitter(self) -> RecursiveCharacterTextSplitter:
+        """
+        Splitter for text sections larger than the chunk size.
+
+        It measures every candidate piece, so it uses a local estimate; the
+        exact tokenizer is only called once per final chunk.
+        """
+        return RecursiveCharacterTextSplitter(
+            chunk_size=self.chunk_size,
+            chunk_overlap=self.chunk_overlap,
+            length_function=estimate_tokens,
+            separators=["\n\n", "\n", ". ", ", ", " ", ""],
+        )
 
     def split_content(self, content: Any) -> List[Document]:
         """
@@ -52,75 +116,72 @@ class MapReduceSummarizer:
             List of Document objects with content and metadata
         """
         if isinstance(content, (dict, list)):
-            # Handle JSON content
+            # Handle JSON content. The splitter sizes chunks by their serialized
+            # length, so the token budget is converted to characters; lists
+            # become index-keyed objects so that they can be split as well
             json_splitter = RecursiveJsonSplitter(
-                max_chunk_size=self.chunk_size,
-                chunk_overlap=self.chunk_overlap,
-                length_function=self.tokenizer.count_tokens,
-                separators=["\n\n", "\n", ". ", ", ", " ", ""],
+                max_chunk_size=self.chunk_size * CHARS_PER_TOKEN
             )
-            return json_splitter.split_documents(
-                [
-                    Document(
-                        page_content=json.dumps(content),
-                        metadata={"content_type": "json"},
-                    )
-                ]
+            json_data = (
+                content
+                if isinstance(content, dict)
+                else {str(i): item for i, item in enumerate(content)}
             )
+            chunks = json_splitter.split_text(json_data, convert_lists=True)
+            chunk_token_counts = self.tokenizer.count_tokens_batch(chunks)
+            final_docs = [
+                Document(
+                    page_content=chunk,
+                    metadata={"content_type": "json", "token_count": token_count},
+                )
+                for chunk, token_count in zip(chunks, chunk_token_counts)
+            ]
         else:
             # Handle text content
             text = content if isinstance(content, str) else str(content)
 
             # First try markdown-aware splitting
-            md_splitter = MarkdownHeaderTextSplitter(
-                headers_to_split_on=[
-                    ("#", "header1"),
-                    ("##", "header2"),
-                    ("###", "header3"),
-                ]
-            )
-            md_docs = md_splitter.split_text(text)
+            md_docs = MARKDOWN_HEADER_SPLITTER.split_text(text)
 
             # Then apply semantic splitting to large sections
-            semantic_splitter = RecursiveCharacterTextSplitter(
-                chunk_size=self.chunk_size,
-                chunk_overlap=self.chunk_overlap,
-                length_function=self.tokenizer.count_tokens,
-                separators=["\n\n", "\n", ". ", ", ", " ", ""],
+            semantic_splitter = self.semantic_splitter
+
+            # Count every section, and later every sub-chunk, in one batch
+            # rather than one tokenizer round trip per piece
+            section_token_counts = self.tokenizer.count_tokens_batch(
+                [doc.page_content for doc in md_docs]
             )
 
             final_docs = []
-            for doc in md_docs:
-                if self.tokenizer.count_tokens(doc.page_content) > self.chunk_size:
+            for doc, section_token_count in zip(md_docs, section_token_counts):
+                if section_token_count > self.chunk_size:
                     # Split large sections further
                     sub_chunks = semantic_splitter.split_text(doc.page_content)
-                    for i, chunk in enumerate(sub_chunks):
-                        final_docs.append(
-                            Document(
-                                page_content=chunk,
-                                metadata={
-                                    **doc.metadata,
-                                    "content_type": "text",
-                                    "chunk_index": i,
-                                    "total_chunks": len(sub_chunks),
-                                    "token_count": self.tokenizer.count_tokens(chunk),
-                                },
-                            )
+                    chunk_token_counts = self.tokenizer.count_tokens_batch(sub_chunks)
+                    final_docs.extend(
+                        Document(
+                            page_content=chunk,
+                            metadata={
+                                **doc.metadata,
+                                "content_type": "text",
+                                "token_count": token_count,
+                            },
                         )
-                else:
-                    doc.metadata.update(
-                        {
-                            "content_type": "text",
-                            "chunk_index": len(final_docs),
-                            "total_chunks": len(md_docs),
-                            "token_count": self.tokenizer.count_tokens(
-                                doc.page_content
-                            ),
-                        }
+                        for chunk, token_count in zip(sub_chunks, chunk_token_counts)
                     )
+                else:
+                    doc.metadata["content_type"] = "text"
+                    doc.metadata["token_count"] = section_token_count
                     final_docs.append(doc)
 
-            return final_docs
+        # Number the chunks once the total is known, so chunk_index and
+        # total_chunks describe the position among all final chunks
+        total_chunks = len(final_docs)
+        for chunk_index, doc in enumerate(final_docs):
+            doc.metadata["chunk_index"] = chunk_index
+            doc.metadata["total_chunks"] = total_chunks
+
+        return final_docs
 
     def combine_summaries_simple(
         self, summaries: List[str], sections: List[str]
@@ -135,15 +196,119 @@ class MapReduceSummarizer:
         Returns:
             Combined summary with proper structure
         """
-        combined = ""
-        for section, summary in zip(sections, summaries):
-            combined += f"## {section}\n{summary}\n\n"
-        return combined.strip()
+        return "\n\n".join(
+            f"## {section}\n{summary}" for section, summary in zip(sections, summaries)
+        ).strip()
+
+    def _cache_key(self, chain, inputs: Dict[str, Any]) -> Optional[str]:
+        """
+        Hash the configured model together with the chain's prompt template
+        and its inputs.
+
+        Returns None for chains that do not start with a prompt template,
+        since their output cannot be tied to a known prompt.
+        """
+        prompt = getattr(chain, "first", None)
+        if not isinstance(prompt, BasePromptTemplate):
+            return None
+        api = self.settings.api
+        provider = api.llm_provider.lower()
+        model = api.gemini_model if provider == "gemini" else api.llm_model
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr((provider, model, api.llm_temperature)).encode())
+        digest.update(str(getattr(prompt, "template", prompt)).encode())
+        digest.update(json.dumps(inputs, sort_keys=True, default=str).encode())
+        return digest.hexdigest()
+
+    async def _ainvoke_chain(self, chain, inputs: Dict[str, Any]) -> Any:
+        """Invoke a chain asynchronously, falling back to a worker thread."""
+        cache_key = self._cache_key(chain, inputs)
+        if cache_key in self.summary_cache:
+            return self.summary_cache[cache_key]
+
+        if hasattr(chain, "ainvoke"):
+            result = await chain.ainvoke(inputs)
+        else:
+            result = await asyncio.to_thread(chain.invoke, inputs)
+
+        if cache_key is not None:
+            self.summary_cache[cache_key] = result
+            self._summary_cache_dirty = True
+            if len(self.summary_cache) > SUMMARY_CACHE_MAX_ENTRIES:
+                del self.summary_cache[next(iter(self.summary_cache))]
+        return result
+
+    def save_summary_cache(self) -> None:
+        """Persist the summary cache if it gained entries since the last save."""
+        if self._summary_cache_dirty:
+            write_pickle_file(self.summary_cache_file_path, self.summary_cache)
+            self._summary_cache_dirty = False
+
+    async def _asafe_invoke(self, doc: Document, key: str) -> Dict[str, Any]:
+        """Summarize a single chunk, recording failures in place of the summary."""
+        logger.info(
+            f"Processing chunk {doc.metadata['chunk_index'] + 1}/{doc.metadata['total_chunks']} "
+            f"({doc.metadata['token_count']} tokens)"
+        )
+        try:
+            summary = await self._ainvoke_chain(
+                self.map_chain, {"key": key, "value": doc.page_content}
+            )
+            return {"content": summary, "metadata": doc.metadata}
+        except Exception as e:
+            logger.error(f"Failed to process chunk: {e}")
+            return {
+                "content": f"[Error processing chunk: {str(e)}]",
+                "metadata": doc.metadata,
+            }
+
+    async def _areduce_section(self, section: str, summaries: List[str]) -> str:
+        """Combine the chunk summaries of one section with the reduce chain."""
+        try:
+            return await self._ainvoke_chain(
+                self.reduce_chain, {"value": "\n\n".join(summaries)}
+            )
+        except Exception as e:
+            logger.error(f"Failed to combine section {section}: {e}")
+            return f"[Error combining section: {str(e)}]"
 
     def process_text(self, key: str, content: Any) -> Dict[str, Any]:
         """
         Process content using either full MapReduce or Map-only pattern.
 
+        Synchronous wrapper around aprocess_text. It also works when called
+        from inside a running event loop, but async callers should await
+        aprocess_text instead of blocking their loop on this.
+
+        Args:
+            key: The key/identifier for this content
+            content: Content to process (can be JSON object or text)
+
+        Returns:
+            Dictionary containing:
+            - final_summary: The combined summary
+            - chunk_summaries: Individual chunk summaries
+            - metadata: Processing metadata
+        """
+
+        async def run() -> Dict[str, Any]:
+            try:
+                return await self.aprocess_text(key, content)
+            finally:
+                # Pooled async LLM connections are bound to this event loop,
+                # which run_async closes; release them while it still runs
+                await aclose_llm_connections()
+
+        return run_async(run(), self.settings.processing.max_workers)
+
+    async def aprocess_text(self, key: str, content: Any) -> Dict[str, Any]:
+        """
+        Process content using either full MapReduce or Map-only pattern.
+
+        At most ``max_concurrency`` chain calls run at once. Each section is
+        reduced as soon as its own chunks are mapped, without waiting for the
+        other sections.
+
         Args:
             key: The key/identifier for this content
             content: Content to process (can be JSON object or text)
@@ -154,79 +319,64 @@ class MapReduceSummarizer:
             - chunk_summaries: Individual chunk summaries
             - metadata: Processing metadata
         """
-        if not key or content is None:
+        # Split content into chunks using appropriate splitter
+        docs = self.split_content(content) if key and content is not None else []
+        if not docs:
             return {
                 "final_summary": "",
                 "section_summaries": {},
                 "chunk_summaries": [],
-                "metadata": {},
+                "metadata": {
+                    "total_chunks": 0,
+                    "total_tokens": 0,
+                    "sections": [],
+                    "reduce_enabled": self.reduce_enabled,
+                },
             }
 
-        # Split content into chunks using appropriate splitter
-        docs = self.split_content(content)
-
-        # Create map chain
-        map_chain = self.map_chain
-
-        # Map phase - process each chunk
-        chunk_summaries = []
-        for doc in docs:
-            logger.info(
-                f"Processing chunk {doc.metadata['chunk_index'] + 1}/{doc.metadata['total_chunks']} "
-                f"({doc.metadata['token_count']} tokens)"
+        # Group chunks by section up front so each section can be reduced as
+        # soon as its own chunks are mapped
+        sections: Dict[str, List[int]] = {}
+        for i, doc in enumerate(docs):
+            sections.setdefault(doc.metadata.get("header1", "General"), []).append(i)
+
+        chunk_summaries: List[Dict[str, Any]] = [{}] * len(docs)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def map_chunk(i: int) -> str:
+            async with semaphore:
+                chunk_summaries[i] = await self._asafe_invoke(docs[i], key)
+            return chunk_summaries[i]["content"]
+
+        async def process_section(section: str, indices: List[int]) -> str:
+            summaries = await asyncio.gather(*(map_chunk(i) for i in indices))
+            if not self.reduce_enabled:
+                return "\n\n".join(summaries)
+            async with semaphore:
+                return await self._areduce_section(section, summaries)
+
+        # Map and reduce phases - every section runs through the bounded pool
+        section_results = await asyncio.gather(
+            *(
+                process_section(section, indices)
+                for section, indices in sections.items()
             )
-
-            try:
-                summary = map_chain.invoke({"key": key, "value": doc.page_content})
-                chunk_summaries.append({"content": summary, "metadata": doc.metadata})
-            except Exception as e:
-                logger.error(f"Failed to process chunk: {e}")
-                chunk_summaries.append(
-                    {
-                        "content": f"[Error processing chunk: {str(e)}]",
-                        "metadata": doc.metadata,
-                    }
-                )
-
-        # Group summaries by section
-        sections = {}
-        for summary in chunk_summaries:
-            section = summary["metadata"].get("header1", "General")
-            if section not in sections:
-                sections[section] = []
-            sections[section].append(summary["content"])
+        )
+        section_summaries = dict(zip(sections.keys(), section_results))
 
         # Process summaries based on reduce_enabled setting
         if self.reduce_enabled:
-            # Create reduce chain
-            reduce_chain = self.reduce_chain
-
-            # Reduce phase - combine summaries
-            section_summaries = {}
-            for section, summaries in sections.items():
-                try:
-                    section_summary = reduce_chain.invoke(
-                        {"value": "\n\n".join(summaries)}
-                    )
-                    section_summaries[section] = section_summary
-                except Exception as e:
-                    logger.error(f"Failed to combine section {section}: {e}")
-                    section_summaries[section] = f"[Error combining section: {str(e)}]"
-
             # Final reduce - combine sections
             try:
-                final_summary = reduce_chain.invoke(
-                    {"value": "\n\n".join(section_summaries.values())}
+                final_summary = await self._ainvoke_chain(
+                    self.reduce_chain,
+                    {"value": "\n\n".join(section_summaries.values())},
                 )
             except Exception as e:
                 logger.error(f"Failed to create final summary: {e}")
                 final_summary = "[Error creating final summary]"
         else:
             # Simple combination without reduce chain
-            section_summaries = {}
-            for section, summaries in sections.items():
-                section_summaries[section] = "\n\n".join(summaries)
-
             final_summary = self.combine_summaries_simple(
                 list(section_summaries.values()), list(sections.keys())
             )
@@ -245,10 +395,10 @@ class MapReduceSummarizer:
 
 
 class Summarizer:
-    def __init__(self, settings: AppSettings, chains=None):
+    def __init__(self, settings: AppSettings, chains=None, tokenizer=None):
         self.settings = settings
         self.chains = chains or Chains(settings)
-        self.tokenizer = GeminiTokenizer(settings)
+        self.tokenizer = tokenizer or GeminiTokenizer(settings)
         self.max_request_tokens = self.settings.api.max_input_tokens_per_request
         self.chunk_size = int(self.max_request_tokens * 0.3)
         self.map_reducer = MapReduceSummarizer(
@@ -270,6 +420,10 @@ class Summarizer:
         """
         if self.settings.api.llm_provider == "local":
             return True
+        # Every token covers at least one UTF-8 byte, so text whose worst-case
+        # encoded size is under the limit fits without a tokenizer round trip
+        if len(text) * MAX_UTF8_BYTES_PER_CHAR < self.chunk_size:
+            return True
         return self.tokenizer.count_tokens(text) < self.chunk_size
 
     def summarize(self) -> str:
@@ -287,8 +441,9 @@ class Summarizer:
             ValueError: If correlated data is empty or invalid
         """
         try:
-            with open(self.settings.file_paths.correlated_file_path, "r") as cor_file:
-                correlated_data = json.load(cor_file)
+            correlated_data = read_json_file(
+                self.settings.file_paths.correlated_file_path
+            )
 
             if not correlated_data:
                 raise ValueError("Correlated data file is empty")
@@ -313,6 +468,9 @@ class Summarizer:
         except Exception as e:
             logger.error(f"Unexpected error during summarization: {e}")
             raise
+        finally:
+            # Written once per run rather than after every document
+            self.map_reducer.save_summary_cache()
 
     def summarize_projects(self, correlated_data: dict) -> str:
         """
@@ -369,27 +527,32 @@ class Summarizer:
         """Summarize feature gates."""
         logger.info("[*] Summarizing feature gates...")
 
-        with open(
-            self.settings.file_paths.correlated_feature_gate_table_file_path, "r"
-        ) as f:
-            feature_gate_artifacts = json.load(f)
+        feature_gate_artifacts = read_json_file(
+            self.settings.file_paths.correlated_feature_gate_table_file_path
+        )
 
-        feature_gate_summaries = {}
+        # Feature gates are summarized independently, so submit them as one
+        # batch and let the chain run up to max_concurrency requests at once
+        feature_gates = list(feature_gate_artifacts)
+        summaries = self.chains.single_feature_gate_summary_chain.batch(
+            [
+                {"feature-gate": json_to_markdown({fg: feature_gate_artifacts[fg]})}
+                for fg in feature_gates
+            ],
+            config={"max_concurrency": self.settings.api.max_concurrency},
+            return_exceptions=True,
+        )
 
-        for feature_gate, artifacts in feature_gate_artifacts.items():
-            if feature_gate not in feature_gate_summaries:
-                try:
-                    summary = self.chains.single_feature_gate_summary_chain.invoke(
-                        {"feature-gate": json_to_markdown({feature_gate: artifacts})}
-                    )
-                    feature_gate_summaries[feature_gate] = (
-                        summary if isinstance(summary, str) else None
-                    )
-                except Exception as e:
-                    logger.error(
-                        f"Failed to summarize feature gate {feature_gate}: {e}"
-                    )
-                    feature_gate_summaries[feature_gate] = None
+        feature_gate_summaries = {}
+        for feature_gate, summary in zip(feature_gates, summaries):
+            # return_exceptions=True puts a failed gate's exception in its slot
+            if isinstance(summary, str):
+                feature_gate_summaries[feature_gate] = summary
+            else:
+                logger.error(
+                    f"Failed to summarize feature gate {feature_gate}: {summary}"
+                )
+                feature_gate_summaries[feature_gate] = None
 
         if not feature_gate_summaries:
             logger.error("No feature gate summaries generated")
@@ -472,7 +635,7 @@ class Summarizer:
             raise ValueError("Value cannot be None")
 
         if not isinstance(value, str):
-            value = json_to_markdown(json.dumps(value))
+            value = json_to_markdown(_to_json_bytes(value))
 
         return self.chains.summary_chain.invoke({"key": key, "value": value})
 
@@ -505,7 +668,7 @@ class Summarizer:
         try:
             if not isinstance(value, str):
                 value = json_to_markdown(
-                    json.dumps(value), jira_server=self.settings.api.jira_server
+                    _to_json_bytes(value), jira_server=self.settings.api.jira_server
                 )
 
             result = self.map_reducer.process_text(key, value)
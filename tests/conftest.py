@@ -0,0 +1,135 @@
+"""Shared pytest fixtures for the test suite."""
+
+import shutil
+import logging
+import pytest
+from contextlib import ExitStack
+from unittest.mock import patch
+from config.settings import get_settings
+from clients.gemini_llm_client import close_gemini_llm_clients
+from utils.file_utils import copy_file
+from utils.logging_config import setup_logging
+from tests.mocks.mock_llm import create_mock_llm
+from tests.mocks.mock_gemini_tokenizer import MockGeminiTokenizer
+
+EXPECTED_FEATURE_GATES: frozenset[str] = frozenset(
+    {
+        "CSIDriverSharedResource",
+        "VSphereControlPlaneMachineSet",
+        "VSphereStaticIPs",
+        "GatewayAPI",
+        "AdditionalRoutingCapabilities",
+        "ConsolePluginContentSecurityPolicy",
+        "MetricsCollectionProfiles",
+        "OnClusterBuild",
+        "OpenShiftPodSecurityAdmission",
+        "RouteExternalCertificate",
+        "ServiceAccountTokenNodeBinding",
+        "CPMSMachineNamePrefix",
+        "GatewayAPIController",
+    }
+)
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config):
+    """Configure logging once for the run, writing logs outside the repository.
+
+    Runs before collection, so modules that set up logging on import (such
+    as runner.py) find it already configured with the temporary log
+    directory. trylast so that pytest's tmp_path factory exists.
+    """
+    get_settings().directories.logs_dir = config._tmp_path_factory.mktemp("logs")
+    if not logging.getLogger().handlers:
+        setup_logging()
+
+
+@pytest.fixture(scope="session")
+def settings():
+    """Application settings shared by the whole test session."""
+    return get_settings()
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_gemini_llms():
+    """Drop the shared Gemini chat models after every test.
+
+    Tests patch ``ChatGoogleGenerativeAI`` with mocks; clearing the shared
+    instances keeps one test's mock from being handed to the next.
+    """
+    yield
+    close_gemini_llm_clients()
+
+
+@pytest.fixture(scope="session")
+def mock_tokenizer():
+    """Stateless mock Gemini tokenizer shared by the whole test session."""
+    return MockGeminiTokenizer()
+
+
+@pytest.fixture(scope="module")
+def mock_llm_clients(mock_tokenizer):
+    """Swap the LLM clients and Gemini tokenizer for mocks for a whole module.
+
+    Module-scoped rather than session-scoped so that test_llm still
+    exercises the real client factories.
+    """
+    with ExitStack() as stack:
+        stack.enter_context(
+            patch(
+                "clients.local_llm_client.create_local_llm",
+                side_effect=create_mock_llm,
+            )
+        )
+        stack.enter_context(
+            patch(
+                "clients.gemini_llm_client.create_gemini_llm",
+                side_effect=create_mock_llm,
+            )
+        )
+        stack.enter_context(
+            patch("summarizers.summarizer.GeminiTokenizer", return_value=mock_tokenizer)
+        )
+        yield
+
+
+@pytest.fixture(scope="module", autouse=True)
+def module_data_dir(tmp_path_factory):
+    """Data directory for a module's shared setup, outside the repository.
+
+    Module-scoped fixtures write their mock and generated files here; each
+    test then starts from a copy of it (see ``data_dir``).
+    """
+    module_data_dir = tmp_path_factory.mktemp("data")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(get_settings().directories, "data_dir", module_data_dir)
+        yield module_data_dir
+
+
+@pytest.fixture(autouse=True)
+def data_dir(module_data_dir, tmp_path, monkeypatch):
+    """Fresh per-test data directory seeded with a copy of the module's files."""
+    data_dir = tmp_path / "data"
+    shutil.copytree(module_data_dir, data_dir)
+    monkeypatch.setattr(get_settings().directories, "data_dir", data_dir)
+    return data_dir
+
+
+@pytest.fixture(scope="module")
+def copy_mock_files():
+    """Return a helper that copies mock files from the test data directory.
+
+    Files land in the current data directory: the module's when called from
+    module-scoped setup, the test's own when called from a test.
+    """
+
+    settings = get_settings()
+
+    def _copy_mock_files(*file_names):
+        for file_name in file_names:
+            copy_file(
+                src_path=settings.directories.test_data_dir / file_name,
+                dest_dir=settings.directories.data_dir,
+            )
+
+    return _copy_mock_files
@@ -1,6 +1,6 @@
 """Mock implementation of Chains class for testing."""
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from langchain_core.runnables import Runnable
 
 
@@ -11,7 +11,12 @@ class MockChain(Runnable):
         super().__init__()
         self.rate_limiter = None
 
-    def invoke(self, input_dict: Dict[str, Any]) -> str:
+    def invoke(
+        self,
+        input_dict: Dict[str, Any],
+        config: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> str:
         """Return a mock summary based on input."""
         if self.rate_limiter:
 
@@ -4,8 +4,11 @@
 class MockGeminiTokenizer:
     """Mock implementation of GeminiTokenizer for testing."""
 
-    def __init__(self, settings=None):
+    def __init__(self, settings=None, chunk_threshold: int = 5000):
         self.settings = settings
+        # Texts longer than this many characters report more tokens than
+        # the model accepts, forcing the chunking code paths.
+        self.chunk_threshold = chunk_threshold
         self.max_input_tokens = 1_048_576  # Gemini's limit
         self.max_output_tokens = 65_536
         self.chunk_size = int(self.max_input_tokens * 0.8)  # 80% of max tokens
@@ -18,19 +21,11 @@ class MockGeminiTokenizer:
         if not isinstance(text, str):
             text = str(text)
 
-        # Handle test patterns for JSON and text content
-        if any(
-            pattern in text
-            for pattern in ["A" * 5000, "B" * 1000, "C" * 3000, "D" * 500]
-        ):
-            # Return a large number for our test data to force chunking
-            return self.max_input_tokens + 500
-
-        # Handle large JSON objects
-        if text.count("{") > 3 and len(text) > 1000:  # Complex nested JSON
-            return self.max_input_tokens + 200
-
-        if len(text) > 5000:  # Large text content
+        if len(text) > self.chunk_threshold:  # Large text content
             return self.max_input_tokens + 100
 
         return len(text) // 4  # Normal approximation for other text
+
+    def count_tokens_batch(self, texts: list) -> list:
+        """Mock batch token counting."""
+        return [self.count_tokens(text) for text in texts]
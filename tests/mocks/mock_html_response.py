@@ -7,6 +7,19 @@ class MockResponse:
     def __init__(self, text, status_code=200):
         self.text = text
         self.status_code = status_code
+        self.encoding = "utf-8"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def iter_content(self, chunk_size=1):
+        """Yield the body as bytes in chunks, like a streamed response."""
+        body = self.text.encode(self.encoding)
+        for start in range(0, len(body), chunk_size):
+            yield body[start : start + chunk_size]
 
     def raise_for_status(self):
         """Raise an HTTPError for bad status codes."""
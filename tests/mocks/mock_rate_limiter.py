@@ -1,6 +1,6 @@
 """Mock implementation of RateLimiter for testing."""
 
-from typing import Callable, TypeVar, ParamSpec
+from typing import Awaitable, Callable, TypeVar, ParamSpec
 from config.settings import AppSettings
 
 P = ParamSpec("P")
@@ -17,16 +17,33 @@ class MockRateLimiter:
         self.rpd_counter = 0
         self.should_fail = False
 
+    def _check(self) -> None:
+        """Raise the configured failure or the daily limit error."""
+        if self.should_fail:
+            raise RuntimeError("Test rate limit error")
+        if self.rpd_counter >= self.max_rpd:
+            raise RuntimeError("Daily API request limit exceeded")
+
     def check_rate_limit(self, func: Callable[P, T]) -> Callable[P, T]:
         """Mock rate limit checking."""
 
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-            if self.should_fail:
-                raise RuntimeError("Test rate limit error")
-            if self.rpd_counter >= self.max_rpd:
-                raise RuntimeError("Daily API request limit exceeded")
+            self._check()
             result = func(*args, **kwargs)
             self.rpd_counter += 1
             return result
 
         return wrapper
+
+    def check_rate_limit_async(
+        self, func: Callable[P, Awaitable[T]]
+    ) -> Callable[P, Awaitable[T]]:
+        """Mock rate limit checking for coroutine functions."""
+
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            self._check()
+            result = await func(*args, **kwargs)
+            self.rpd_counter += 1
+            return result
+
+        return wrapper
@@ -0,0 +1,58 @@
+"""Tests for file utilities."""
+
+import os
+import shutil
+import pytest
+from utils.file_utils import copy_file, read_pickle_file, write_pickle_file
+
+
+def test_copy_file(tmp_path):
+    """Test that a file is copied into the destination directory."""
+    src_path = tmp_path / "source.txt"
+    src_path.write_text("content")
+
+    dest_path = copy_file(src_path, tmp_path / "dest")
+
+    assert dest_path == tmp_path / "dest" / "source.txt"
+    assert dest_path.read_text() == "content"
+
+
+def test_copy_file_into_own_directory_keeps_source(tmp_path):
+    """Test that copying a file onto itself is refused instead of truncating it."""
+    src_path = tmp_path / "source.txt"
+    src_path.write_text("content")
+
+    with pytest.raises(shutil.SameFileError):
+        copy_file(src_path, tmp_path)
+
+    assert src_path.read_text() == "content"
+
+
+def test_copy_file_falls_back_when_copy_file_range_copies_nothing(
+    tmp_path, monkeypatch
+):
+    """Test that a source copy_file_range reads as empty is still copied."""
+    src_path = tmp_path / "source.txt"
+    src_path.write_text("content")
+    # Like procfs and sysfs files: the first call returns 0 without an error
+    monkeypatch.setattr(os, "copy_file_range", lambda *args: 0, raising=False)
+
+    dest_path = copy_file(src_path, tmp_path / "dest")
+
+    assert dest_path.read_text() == "content"
+
+
+def test_read_pickle_file(tmp_path):
+    """Test that pickles round-trip and unreadable files give None."""
+    pickle_path = tmp_path / "cache.pkl"
+    data = {"key": ["value"] * 100}
+    assert write_pickle_file(pickle_path, data)
+    assert read_pickle_file(pickle_path) == data
+
+    # A file cut short mid-write is reported as missing, not raised
+    pickle_path.write_bytes(pickle_path.read_bytes()[:10])
+    assert read_pickle_file(pickle_path) is None
+
+    pickle_path.write_bytes(b"")
+    assert read_pickle_file(pickle_path) is None
+    assert read_pickle_file(tmp_path / "missing.pkl") is None
@@ -1,36 +1,35 @@
 import unittest
+import pytest
 import pandas as pd
+from unittest.mock import patch
 from scrapers.html_scraper import HtmlScraper
 from filters.filter_enabled_feature_gates import filter_enabled_feature_gates
 from scrapers.scrapers import Scraper
 from config.settings import get_settings
-from utils.file_utils import delete_all_in_directory, copy_file
-from utils.logging_config import setup_logging, get_logger
+from utils.logging_config import get_logger
+from tests.mocks.mock_html_response import MockResponse
 
 logger = get_logger(__name__)
 
-# Set up logging for tests
-setup_logging()
-
 settings = get_settings()
-data_dir = settings.directories.data_dir
-
-table_file = data_dir / "feature_gate_table.pkl"
 test_data_dir = settings.directories.test_data_dir
+remote_release_page = (test_data_dir / "release_page_remote.html").read_text()
 
 
-class TestFilters(unittest.TestCase):
-    def setUp(self):
-        # Ensure data directory exists and is clean
-        settings.directories.data_dir.mkdir(parents=True, exist_ok=True)
-        delete_all_in_directory(data_dir)
+def get_mock_remote_response(url, *args, **kwargs):
+    """Serve the canned remote release page instead of hitting the network."""
+    return MockResponse(remote_release_page)
 
-    def tearDown(self):
-        # Clean up after each test
-        delete_all_in_directory(data_dir)
 
-    def test_df_filter_enabled_feature_gates_remote(self):
-        """Test filtering enabled feature gates from remote URL"""
+class TestFilters(unittest.TestCase):
+    @pytest.fixture(autouse=True)
+    def isolated_data_dir(self, data_dir):
+        """Expose the test's own data directory to the unittest methods."""
+        self.data_dir = data_dir
+
+    @patch("requests.Session.get", side_effect=get_mock_remote_response)
+    def test_df_filter_enabled_feature_gates_remote(self, mock_get):
+        """Test filtering enabled feature gates from a (mocked) remote URL"""
         # Use remote URL
         remote_url = "https://amd64.origin.releases.ci.openshift.org/releasestream/4-scos-next/release/4.20.0-okd-scos.ec.13"
         remote_scraper = HtmlScraper(remote_url, settings)
@@ -38,9 +37,10 @@ class TestFilters(unittest.TestCase):
         try:
             # Extract data from remote URL
             remote_scraper.extract()
+            mock_get.assert_called_once_with(remote_url, stream=True, timeout=30)
 
             # Read and filter the data
-            dfs = pd.read_pickle(table_file)
+            dfs = pd.read_pickle(settings.file_paths.feature_gate_table_file_path)
             self.assertIsInstance(dfs, list, "Expected a list of DataFrames")
             self.assertGreater(len(dfs), 0, "Expected at least one DataFrame")
 
@@ -90,11 +90,9 @@ class TestFilters(unittest.TestCase):
 
     def test_filter_urls_basic_functionality(self):
         """Test that filter_urls correctly filters URLs based on source_server_map"""
-        urls_file = data_dir / "urls.txt"
-        github_urls_file = data_dir / "github_urls.txt"
-        jira_urls_file = data_dir / "jira_urls.txt"
-
-        delete_all_in_directory(data_dir)
+        urls_file = self.data_dir / "urls.txt"
+        github_urls_file = self.data_dir / "github_urls.txt"
+        jira_urls_file = self.data_dir / "jira_urls.txt"
 
         # Create test URLs
         test_urls = [
@@ -120,8 +118,7 @@ class TestFilters(unittest.TestCase):
         self.assertTrue(jira_urls_file.exists())
 
         # Verify content of GitHub URLs file
-        with open(github_urls_file, "r") as f:
-            github_urls = f.read().strip().split("\n")
+        github_urls = github_urls_file.read_text().strip().split("\n")
         expected_github_urls = [
             "https://github.com/openshift/some-repo/pull/123",
             "https://github.com/another/repo/commit/abc123",
@@ -129,8 +126,7 @@ class TestFilters(unittest.TestCase):
         self.assertEqual(github_urls, expected_github_urls)
 
         # Verify content of JIRA URLs file
-        with open(jira_urls_file, "r") as f:
-            jira_urls = f.read().strip().split("\n")
+        jira_urls = jira_urls_file.read_text().strip().split("\n")
         expected_jira_urls = [
             "https://issues.redhat.com/browse/JIRA-456",
             "https://issues.redhat.com/browse/OCPBUGS-789",
@@ -139,10 +135,10 @@ class TestFilters(unittest.TestCase):
 
     def test_filter_urls_with_mixed_urls(self):
         """Test filter_urls with mixed URLs including some that don't match"""
-        urls_file = data_dir / "urls.txt"
+        urls_file = self.data_dir / "urls.txt"
 
-        github_urls_file = data_dir / "github_urls.txt"
-        jira_urls_file = data_dir / "jira_urls.txt"
+        github_urls_file = self.data_dir / "github_urls.txt"
+        jira_urls_file = self.data_dir / "jira_urls.txt"
 
         test_urls = [
             "https://github.com/openshift/repo1/pull/123",
@@ -161,21 +157,66 @@ class TestFilters(unittest.TestCase):
         source_server_map = settings.api.source_server_map
         if "GITHUB" in source_server_map:
             self.assertTrue(github_urls_file.exists())
-            with open(github_urls_file, "r") as f:
-                github_urls = f.read().strip().split("\n")
-                # Should contain GitHub URLs only
-                self.assertIn(
-                    "https://github.com/openshift/repo1/pull/123", github_urls
-                )
-                self.assertIn(
-                    "https://github.com/openshift/repo2/pull/456", github_urls
-                )
+            github_urls = github_urls_file.read_text().strip().split("\n")
+            # Should contain GitHub URLs only
+            self.assertIn("https://github.com/openshift/repo1/pull/123", github_urls)
+            self.assertIn("https://github.com/openshift/repo2/pull/456", github_urls)
         if "JIRA" in source_server_map:
             self.assertTrue(jira_urls_file.exists())
-            with open(jira_urls_file, "r") as f:
-                jira_urls = f.read().strip().split("\n")
-                # Should contain JIRA URLs only
-                self.assertIn("https://issues.redhat.com/browse/JIRA-789", jira_urls)
+            jira_urls = jira_urls_file.read_text().strip().split("\n")
+            # Should contain JIRA URLs only
+            self.assertIn("https://issues.redhat.com/browse/JIRA-789", jira_urls)
+
+    def test_filter_urls_removes_duplicates_in_order(self):
+        """Test that filter_urls keeps the first occurrence of each URL in file order"""
+        urls_file = self.data_dir / "urls.txt"
+        github_urls_file = self.data_dir / "github_urls.txt"
+
+        test_urls = [
+            "https://github.com/openshift/repo2/pull/456",
+            "https://github.com/openshift/repo1/pull/123",
+            "https://github.com/openshift/repo2/pull/456",
+            "https://issues.redhat.com/browse/JIRA-789",
+            "https://github.com/openshift/repo1/pull/123",
+        ]
+        urls_file.write_text("\n".join(test_urls) + "\n")
+
+        scraper = Scraper({"url": "https://example.com", "filter_on": True}, settings)
+        urls_dict = scraper.filter_urls_by_source()
+
+        expected_github_urls = [
+            "https://github.com/openshift/repo2/pull/456",
+            "https://github.com/openshift/repo1/pull/123",
+        ]
+        self.assertEqual(urls_dict["github"], expected_github_urls)
+        self.assertEqual(
+            github_urls_file.read_text().strip().split("\n"), expected_github_urls
+        )
+
+    def test_scrape_runs_sources_independently(self):
+        """Test that every source is scraped and one failure does not stop the others"""
+        scraped = []
+
+        class OkScraper:
+            def __init__(self, settings, urls, **kwargs):
+                pass
+
+            def extract(self):
+                scraped.append("jira")
+
+        class FailingScraper(OkScraper):
+            def extract(self):
+                raise RuntimeError("boom")
+
+        kwargs = {"jira": {"issue_ids": ["OCPBUGS-1"]}, "github": {"username": "x"}}
+        scraper = Scraper(kwargs, settings)
+        with patch.dict(
+            Scraper.SOURCE_SCRAPERS_MAP,
+            {"jira": OkScraper, "github": FailingScraper},
+        ):
+            scraper.scrape()
+
+        self.assertEqual(scraped, ["jira"])
 
     def test_source_server_map_functionality(self):
         """Test that source_server_map returns the expected mapping"""
@@ -26,7 +26,7 @@ def mock_gemini_model():
 
 def test_initialization(settings):
     """Test tokenizer initialization."""
-    with patch("utils.gemini_tokenizer.ChatGoogleGenerativeAI") as mock_chat:
+    with patch("langchain_google_genai.ChatGoogleGenerativeAI") as mock_chat:
         mock_chat.return_value = MagicMock()
         tokenizer = GeminiTokenizer(settings)
 
@@ -40,7 +40,7 @@ def test_initialization(settings):
 
 def test_count_tokens(settings, mock_gemini_model):
     """Test token counting functionality."""
-    with patch("utils.gemini_tokenizer.ChatGoogleGenerativeAI") as mock_chat:
+    with patch("langchain_google_genai.ChatGoogleGenerativeAI") as mock_chat:
         mock_chat.return_value = mock_gemini_model
         tokenizer = GeminiTokenizer(settings)
 
@@ -62,7 +62,7 @@ def test_count_tokens(settings, mock_gemini_model):
 
 def test_error_handling(settings, mock_gemini_model):
     """Test error handling during token counting."""
-    with patch("utils.gemini_tokenizer.ChatGoogleGenerativeAI") as mock_chat:
+    with patch("langchain_google_genai.ChatGoogleGenerativeAI") as mock_chat:
         mock_chat.return_value = mock_gemini_model
         tokenizer = GeminiTokenizer(settings)
 
@@ -75,7 +75,7 @@ def test_error_handling(settings, mock_gemini_model):
 
 def test_special_characters(settings, mock_gemini_model):
     """Test token counting with special characters."""
-    with patch("utils.gemini_tokenizer.ChatGoogleGenerativeAI") as mock_chat:
+    with patch("langchain_google_genai.ChatGoogleGenerativeAI") as mock_chat:
         mock_chat.return_value = mock_gemini_model
         tokenizer = GeminiTokenizer(settings)
 
@@ -97,7 +97,7 @@ def test_special_characters(settings, mock_gemini_model):
 
 def test_code_snippets(settings, mock_gemini_model):
     """Test token counting with code snippets."""
-    with patch("utils.gemini_tokenizer.ChatGoogleGenerativeAI") as mock_chat:
+    with patch("langchain_google_genai.ChatGoogleGenerativeAI") as mock_chat:
         mock_chat.return_value = mock_gemini_model
         tokenizer = GeminiTokenizer(settings)
 
@@ -116,7 +116,7 @@ def test_code_snippets(settings, mock_gemini_model):
 
 def test_markdown_text(settings, mock_gemini_model):
     """Test token counting with markdown text."""
-    with patch("utils.gemini_tokenizer.ChatGoogleGenerativeAI") as mock_chat:
+    with patch("langchain_google_genai.ChatGoogleGenerativeAI") as mock_chat:
         mock_chat.return_value = mock_gemini_model
         tokenizer = GeminiTokenizer(settings)
 
@@ -133,3 +133,42 @@ def test_markdown_text(settings, mock_gemini_model):
         ```"""
         mock_gemini_model.get_num_tokens.return_value = 30
         assert tokenizer.count_tokens(markdown) == 30
+
+
+def test_repeated_text_is_counted_once(settings, mock_gemini_model):
+    """Test that counting the same text again is served from the cache."""
+    with patch("langchain_google_genai.ChatGoogleGenerativeAI") as mock_chat:
+        mock_chat.return_value = mock_gemini_model
+        tokenizer = GeminiTokenizer(settings)
+
+        assert tokenizer.count_tokens("repeated text") == 10
+        assert tokenizer.count_tokens("repeated text") == 10
+        assert tokenizer.count_tokens("other text") == 10
+
+        assert mock_gemini_model.get_num_tokens.call_count == 2
+
+
+def test_long_text_cache_is_keyed_by_digest(settings, mock_gemini_model):
+    """Test that long texts are cached without keeping the text as the key."""
+    with patch("langchain_google_genai.ChatGoogleGenerativeAI") as mock_chat:
+        mock_chat.return_value = mock_gemini_model
+        tokenizer = GeminiTokenizer(settings)
+
+        long_text = "chunk " * 1000
+        assert tokenizer.count_tokens(long_text) == 10
+        assert tokenizer.count_tokens(long_text) == 10
+
+        assert mock_gemini_model.get_num_tokens.call_count == 1
+        assert long_text not in tokenizer._token_counts
+
+
+def test_count_tokens_batch(settings, mock_gemini_model):
+    """Test that batch counting keeps input order and counts each text once."""
+    with patch("langchain_google_genai.ChatGoogleGenerativeAI") as mock_chat:
+        mock_chat.return_value = mock_gemini_model
+        mock_gemini_model.get_num_tokens.side_effect = len
+        tokenizer = GeminiTokenizer(settings)
+
+        texts = ["one", "three", "one", "fifteen"]
+        assert tokenizer.count_tokens_batch(texts) == [3, 5, 3, 7]
+        assert mock_gemini_model.get_num_tokens.call_count == 3
@@ -7,14 +7,10 @@ from scrapers.github_scraper import GithubScraper
 from scrapers.exceptions import ScraperException
 from utils.utils import get_urls
 from config.settings import get_settings
-from utils.file_utils import copy_file, delete_all_in_directory
-from utils.logging_config import setup_logging
+from utils.file_utils import copy_file
 
-setup_logging()
 settings = get_settings()
-data_dir = settings.directories.data_dir
 test_data_dir = settings.directories.test_data_dir
-github_file_path = data_dir / "github.json"
 
 
 class TestGithubScraper(unittest.TestCase):
@@ -86,8 +82,9 @@ class TestGithubScraper(unittest.TestCase):
         url = "https://amd64.origin.releases.ci.openshift.org/releasestream/4-scos-stable/release/4.19.0-okd-scos.0"
 
         # Run the pipeline
-        delete_all_in_directory(data_dir)
-        copy_file(src_path=test_data_dir / "urls.txt", dest_dir=data_dir)
+        copy_file(
+            src_path=test_data_dir / "urls.txt", dest_dir=settings.directories.data_dir
+        )
 
         # Create scraper instance to access filter functionality
         scraper = Scraper({"url": "https://example.com", "filter_on": True}, settings)
@@ -114,7 +111,7 @@ class TestGithubScraper(unittest.TestCase):
 
 
 def load_github_file():
-    with open(github_file_path, "r") as f:
+    with open(settings.file_paths.github_json_file_path, "r") as f:
         return json.load(f)
 
 
@@ -7,7 +7,6 @@ from config.settings import get_settings
 from tests.mocks.mock_html_response import MockResponse
 
 settings = get_settings()
-data_dir = settings.directories.data_dir
 url = "https://amd64.origin.releases.ci.openshift.org/releasestream/4-scos-next/release/4.20.0-okd-scos.ec.13"
 scraper = HtmlScraper(url, settings)
 
@@ -20,18 +19,18 @@ def get_mock_html_response(url, *args, **kwargs):
         *args: Variable length argument list (ignored in mock)
         **kwargs: Arbitrary keyword arguments (ignored in mock)
     """
-    with open(settings.directories.test_data_dir / "release_page.html", "r") as f:
-        html_content = f.read()
+    html_content = (
+        settings.directories.test_data_dir / "release_page.html"
+    ).read_text()
     return MockResponse(html_content)
 
 
 class TestHtmlScraper(unittest.TestCase):
-    @patch("requests.get", side_effect=get_mock_html_response)
+    @patch("requests.Session.get", side_effect=get_mock_html_response)
     def test_scrape_valid_urls(self, mock_get):
         """Test that valid URLs are extracted from the HTML content."""
         scraper.extract()
-        with open(data_dir / "urls.txt", "r") as f:
-            result = f.read()
+        result = settings.file_paths.urls_file_path.read_text()
         self.assertGreater(len(result), 0)
         # Verify we have the expected URLs from release_page.html
         self.assertIn("https://github.com/openshift/api/pull/1234", result)
@@ -4,12 +4,8 @@ from typing import Dict
 from scrapers.jira_scraper import JiraScraper, render_to_markdown
 from scrapers.exceptions import ScraperException
 from config.settings import get_settings
-from utils.logging_config import setup_logging
 from utils.file_utils import copy_file
 
-# Set up logging for tests
-setup_logging()
-
 settings = get_settings()
 
 urls = [
@@ -362,8 +358,7 @@ def load_jira_files():
     with open(settings.file_paths.jira_json_file_path) as f:
         result = json.load(f)
 
-    with open(settings.file_paths.jira_md_file_path) as f:
-        result_md = f.read()
+    result_md = settings.file_paths.jira_md_file_path.read_text()
 
     return result, result_md
 
@@ -2,7 +2,7 @@
 Test module for LLM integration with both local and Gemini providers.
 """
 
-import os
+import asyncio
 import unittest
 from unittest.mock import patch, MagicMock
 from clients.llm_factory import get_llm
@@ -58,16 +58,11 @@ class TestLLMIntegration(unittest.TestCase):
             else:
                 raise
 
-    @patch.dict(os.environ, {"LLM_PROVIDER": "local"})
     def test_local_provider_selection(self):
         """Test that local provider is correctly selected."""
-        # Need to reload settings after changing environment
-        from config.settings import get_settings
-
-        settings = get_settings()
-
-        # Clear any cached settings
-        get_settings.cache_clear()
+        patcher = patch.object(self.settings.api, "llm_provider", "local")
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
         # Test that factory can handle local provider
         try:
@@ -81,13 +76,12 @@ class TestLLMIntegration(unittest.TestCase):
             else:
                 raise
 
-    @patch.dict(os.environ, {"LLM_PROVIDER": "gemini", "GOOGLE_API_KEY": "test-key"})
     def test_gemini_provider_selection(self):
         """Test that Gemini provider is correctly selected."""
-        # Clear any cached settings
-        from config.settings import get_settings
-
-        get_settings.cache_clear()
+        for name, value in (("llm_provider", "gemini"), ("google_api_key", "test-key")):
+            patcher = patch.object(self.settings.api, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
 
         try:
             llm_client = get_llm(self.settings.api)
@@ -111,35 +105,19 @@ class TestLLMIntegration(unittest.TestCase):
 
     def test_gemini_requires_api_key(self):
         """Test that Gemini provider requires API key."""
-        with patch.dict(os.environ, {"LLM_PROVIDER": "gemini"}, clear=False):
-            # Remove GOOGLE_API_KEY if it exists
-            if "GOOGLE_API_KEY" in os.environ:
-                del os.environ["GOOGLE_API_KEY"]
-
-            # Clear cached settings
-            from config.settings import get_settings
-
-            get_settings.cache_clear()
-            # Get fresh settings after clearing cache
-            fresh_settings = get_settings()
-
+        with patch.object(self.settings.api, "llm_provider", "gemini"), patch.object(
+            self.settings.api, "google_api_key", ""
+        ):
             with self.assertRaises(ValueError) as context:
-                get_llm(fresh_settings.api)
+                get_llm(self.settings.api)
 
             self.assertIn("GOOGLE_API_KEY", str(context.exception))
 
     def test_invalid_provider_raises_error(self):
         """Test that invalid provider raises appropriate error."""
-        with patch.dict(os.environ, {"LLM_PROVIDER": "invalid"}, clear=False):
-            # Clear cached settings
-            from config.settings import get_settings
-
-            get_settings.cache_clear()
-            # Get fresh settings after clearing cache
-            fresh_settings = get_settings()
-
+        with patch.object(self.settings.api, "llm_provider", "invalid"):
             with self.assertRaises(ValueError) as context:
-                get_llm(fresh_settings.api)
+                get_llm(self.settings.api)
 
             self.assertIn("Unsupported LLM provider", str(context.exception))
 
@@ -155,6 +133,65 @@ class TestLLMIntegration(unittest.TestCase):
         response = mock_client.invoke("What is 2+2?")
         self.assertEqual(response, "4")
 
+    def test_local_llm_client_is_shared(self):
+        """Test that local LLM clients reuse a single pooled Ollama client."""
+        from clients.local_llm_client import (
+            _get_shared_ollama_llm,
+            close_local_llm_clients,
+        )
+
+        first = _get_shared_ollama_llm(self.settings.api)
+        second = _get_shared_ollama_llm(self.settings.api)
+        self.assertIs(first, second)
+
+        close_local_llm_clients()
+        self.assertIsNot(first, _get_shared_ollama_llm(self.settings.api))
+        close_local_llm_clients()
+
+    def test_local_llm_clients_share_closable_transports(self):
+        """Test that every local LLM client uses one owned pair of transports."""
+        from clients import local_llm_client
+
+        api_settings = self.settings.api.model_copy()
+        local_llm_client._get_shared_ollama_llm(api_settings)
+        transports = local_llm_client._HTTP_TRANSPORTS
+        self.assertIsNotNone(transports)
+
+        # A client for another model reuses the same connection pools
+        api_settings.llm_model = "another-model"
+        local_llm_client._get_shared_ollama_llm(api_settings)
+        self.assertIs(local_llm_client._HTTP_TRANSPORTS, transports)
+
+        local_llm_client.close_local_llm_clients()
+        self.assertIsNone(local_llm_client._HTTP_TRANSPORTS)
+
+    def test_close_local_llm_clients_builds_fresh_transports(self):
+        """Test that a client created after closing gets new transports."""
+        from clients import local_llm_client
+
+        local_llm_client._get_shared_ollama_llm(self.settings.api)
+        transports = local_llm_client._HTTP_TRANSPORTS
+
+        local_llm_client.close_local_llm_clients()
+        local_llm_client._get_shared_ollama_llm(self.settings.api)
+        self.assertIsNotNone(local_llm_client._HTTP_TRANSPORTS)
+        self.assertIsNot(local_llm_client._HTTP_TRANSPORTS, transports)
+        local_llm_client.close_local_llm_clients()
+
+    def test_close_local_llm_clients_inside_running_loop(self):
+        """Test that closing from async code schedules the close instead of raising."""
+        from clients import local_llm_client
+
+        async def create_and_close():
+            local_llm_client._get_shared_ollama_llm(self.settings.api)
+            local_llm_client.close_local_llm_clients()
+            # Let the scheduled close of the async pool run on this loop
+            await asyncio.gather(*local_llm_client._CLOSING_TASKS)
+
+        asyncio.run(create_and_close())
+        self.assertIsNone(local_llm_client._HTTP_TRANSPORTS)
+        self.assertFalse(local_llm_client._CLOSING_TASKS)
+
     def test_configuration_values(self):
         """Test that configuration values are reasonable."""
         settings = get_settings()
@@ -173,13 +210,6 @@ class TestLLMIntegration(unittest.TestCase):
             len(settings.api.gemini_model), 0, "Gemini model name should not be empty"
         )
 
-    def tearDown(self):
-        """Clean up after tests."""
-        # Clear any cached settings to avoid test interference
-        from config.settings import get_settings
-
-        get_settings.cache_clear()
-
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,18 +1,22 @@
 """Tests for MapReduceChainManager."""
 
 import json
+import asyncio
 import pytest
 from unittest.mock import patch, MagicMock
 from config.settings import AppSettings
 from summarizers.summarizer import MapReduceSummarizer
 from langchain_core.documents import Document
 from chains.chains import Chains
+from langchain_core.prompts import PromptTemplate
+from langchain_core.runnables import RunnableLambda
 
 
 @pytest.fixture
-def settings():
+def settings(tmp_path):
     """Create test settings."""
     settings = AppSettings()
+    settings.directories.data_dir = tmp_path
     settings.api.llm_provider = "local"
     settings.api.llm_model = "mistral"
     settings.api.max_input_tokens_per_request = 8192
@@ -22,9 +26,10 @@ def settings():
 
 
 @pytest.fixture
-def gemini_settings():
+def gemini_settings(tmp_path):
     """Create test settings for Gemini."""
     settings = AppSettings()
+    settings.directories.data_dir = tmp_path
     settings.api.llm_provider = "gemini"
     settings.api.llm_model = "gemini-pro"
     settings.api.max_input_tokens_per_request = 1_048_576
@@ -42,6 +47,10 @@ class MockTokenizer:
             text = json.dumps(text)
         return len(str(text)) // 4  # Simple approximation
 
+    def count_tokens_batch(self, texts: list) -> list:
+        """Mock batch token counting."""
+        return [self.count_tokens(text) for text in texts]
+
 
 class MockChain:
     """Mock chain for testing."""
@@ -106,6 +115,25 @@ Content for section 2"""
     assert all("total_chunks" in doc.metadata for doc in docs)
 
 
+def test_split_content_numbers_chunks_across_sections(settings, mock_chains):
+    """Test chunk numbering spans both split and unsplit sections."""
+    settings.api.max_input_tokens_per_request = 1000
+    settings.api.chunk_overlap = 10
+    text = "# Small\nShort section\n\n# Large\n" + "Long sentence here. " * 200
+
+    manager = MapReduceSummarizer(
+        map_chain=mock_chains.map_chain,
+        reduce_chain=mock_chains.reduce_chain,
+        tokenizer=MockTokenizer(),
+        settings=settings,
+    )
+    docs = manager.split_content(text)
+
+    assert len(docs) > 2
+    assert [doc.metadata["chunk_index"] for doc in docs] == list(range(len(docs)))
+    assert all(doc.metadata["total_chunks"] == len(docs) for doc in docs)
+
+
 def test_split_content_json(settings, mock_chains):
     """Test JSON content splitting functionality."""
     json_data = {
@@ -179,6 +207,167 @@ Description of project B"""
     assert len(result["chunk_summaries"]) > 0
 
 
+def test_process_text_async(settings, mock_chains):
+    """Test that aprocess_text matches the synchronous wrapper."""
+    text = """# Project A
+Description of project A
+
+# Project B
+Description of project B"""
+
+    manager = MapReduceSummarizer(
+        map_chain=mock_chains.map_chain,
+        reduce_chain=mock_chains.reduce_chain,
+        tokenizer=MockTokenizer(),
+        settings=settings,
+    )
+    async_result = asyncio.run(manager.aprocess_text("test", text))
+    sync_result = manager.process_text("test", text)
+
+    assert async_result == sync_result
+    assert [s["metadata"]["header1"] for s in async_result["chunk_summaries"]] == [
+        "Project A",
+        "Project B",
+    ]
+
+
+class TrackingChain:
+    """Async mock chain that records how many calls are in flight at once."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def ainvoke(self, inputs: dict) -> str:
+        """Mock ainvoke that yields to the event loop while 'running'."""
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        return f"Summary of {inputs.get('key', 'section')}"
+
+
+def test_process_text_bounds_concurrency(settings):
+    """Test that no more than max_concurrency chain calls run at once."""
+    settings.api.max_concurrency = 2
+    chain = TrackingChain()
+    manager = MapReduceSummarizer(
+        map_chain=chain,
+        reduce_chain=chain,
+        tokenizer=MockTokenizer(),
+        settings=settings,
+    )
+    text = "\n\n".join(f"# Section {i}\nContent {i}" for i in range(6))
+
+    result = manager.process_text("test", text)
+
+    assert len(result["chunk_summaries"]) == 6
+    assert len(result["section_summaries"]) == 6
+    assert chain.max_in_flight == 2
+
+
+def _prompt_chains(calls):
+    """Prompt-led map and reduce chains whose LLM records every prompt."""
+
+    def fake_llm(prompt):
+        calls.append(prompt.to_string())
+        return f"Summary {len(calls)}"
+
+    chain = PromptTemplate.from_template("Summarize {key}: {value}") | RunnableLambda(
+        fake_llm
+    )
+    reduce_chain = PromptTemplate.from_template("Combine: {value}") | RunnableLambda(
+        fake_llm
+    )
+    return chain, reduce_chain
+
+
+def test_process_text_reuses_cached_summaries(settings):
+    """Test that identical prompts are answered from the persisted summary cache."""
+    calls = []
+    chain, reduce_chain = _prompt_chains(calls)
+    text = "# Section A\nContent A\n\n# Section B\nContent B"
+
+    def run():
+        manager = MapReduceSummarizer(
+            map_chain=chain,
+            reduce_chain=reduce_chain,
+            tokenizer=MockTokenizer(),
+            settings=settings,
+        )
+        result = manager.process_text("test", text)
+        manager.save_summary_cache()
+        return result
+
+    first = run()
+    calls_after_first_run = len(calls)
+    second = run()
+
+    assert calls_after_first_run > 0
+    assert len(calls) == calls_after_first_run
+    assert second["final_summary"] == first["final_summary"]
+
+
+def test_summary_cache_is_keyed_on_model(settings):
+    """Test that switching the model does not reuse another model's summaries."""
+    calls = []
+    chain, reduce_chain = _prompt_chains(calls)
+    manager = MapReduceSummarizer(
+        map_chain=chain,
+        reduce_chain=reduce_chain,
+        tokenizer=MockTokenizer(),
+        settings=settings,
+    )
+    text = "# Section A\nContent A"
+
+    manager.process_text("test", text)
+    calls_with_first_model = len(calls)
+    settings.api.llm_model = "llama3"
+    manager.process_text("test", text)
+
+    assert len(calls) == 2 * calls_with_first_model
+
+
+def test_summary_cache_is_saved_on_request(settings):
+    """Test that process_text leaves persisting the cache to save_summary_cache."""
+    calls = []
+    chain, reduce_chain = _prompt_chains(calls)
+    manager = MapReduceSummarizer(
+        map_chain=chain,
+        reduce_chain=reduce_chain,
+        tokenizer=MockTokenizer(),
+        settings=settings,
+    )
+    cache_file = settings.file_paths.summary_cache_file_path
+
+    manager.process_text("test", "# Section A\nContent A")
+    assert not cache_file.exists()
+
+    manager.save_summary_cache()
+    assert cache_file.exists()
+
+
+def test_summary_cache_is_bounded(settings, monkeypatch):
+    """Test that the summary cache evicts its oldest entries past the limit."""
+    monkeypatch.setattr("summarizers.summarizer.SUMMARY_CACHE_MAX_ENTRIES", 2)
+    calls = []
+    chain, _ = _prompt_chains(calls)
+    manager = MapReduceSummarizer(
+        map_chain=chain,
+        reduce_chain=chain,
+        tokenizer=MockTokenizer(),
+        settings=settings,
+    )
+
+    for value in ("one", "two", "three"):
+        asyncio.run(manager._ainvoke_chain(chain, {"key": "k", "value": value}))
+
+    assert len(manager.summary_cache) == 2
+    assert manager._cache_key(chain, {"key": "k", "value": "one"}) not in (
+        manager.summary_cache
+    )
+
+
 def test_process_text_with_large_sections(settings, mock_chains):
     """Test processing text with sections that need further splitting."""
     large_text = (
@@ -1,6 +1,9 @@
 """Tests for RateLimiter."""
 
+import time
+import asyncio
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock
 from config.settings import AppSettings
 from utils.rate_limiter import RateLimiter
@@ -159,3 +162,115 @@ def test_error_propagation(rate_limiter):
         wrapped_func()
     assert "Custom error" in str(exc_info.value)
     assert rate_limiter.rpd_counter == 0  # Counter should not increment
+
+
+def test_concurrent_requests_respect_daily_limit(rate_limiter):
+    """Test that threads calling at once never exceed the daily budget."""
+
+    def slow_func():
+        time.sleep(0.01)
+        return "success"
+
+    wrapped_func = rate_limiter.check_rate_limit(slow_func)
+    calls = 3 * rate_limiter.max_rpd
+
+    def call():
+        try:
+            return wrapped_func()
+        except RuntimeError:
+            return None
+
+    with ThreadPoolExecutor(max_workers=calls) as executor:
+        results = list(executor.map(lambda _: call(), range(calls)))
+
+    assert results.count("success") == rate_limiter.max_rpd
+    assert rate_limiter.rpd_counter == rate_limiter.max_rpd
+
+
+def test_daily_limit_resets_on_new_day(rate_limiter):
+    """Test that the daily budget starts over once the day changes."""
+    mock_func = MagicMock(return_value="success")
+    wrapped_func = rate_limiter.check_rate_limit(mock_func)
+    rate_limiter.rpd_counter = rate_limiter.max_rpd
+
+    with pytest.raises(RuntimeError):
+        wrapped_func()
+
+    # Pretend the counter was last reset yesterday
+    rate_limiter._rpd_day -= 1
+    assert wrapped_func() == "success"
+    assert rate_limiter.rpd_counter == 1
+
+
+def test_requests_per_minute_allows_burst(settings):
+    """Test that requests within the per-minute bucket are not delayed."""
+    settings.api.max_requests_per_minute = 60
+    limiter = RateLimiter(settings)
+
+    delays = [limiter._reserve() for _ in range(60)]
+
+    assert delays == [0.0] * 60
+
+
+def test_requests_per_minute_spreads_excess(settings):
+    """Test that requests beyond the bucket wait for refilled tokens in turn."""
+    settings.api.max_requests_per_minute = 60
+    limiter = RateLimiter(settings)
+    for _ in range(60):
+        limiter._reserve()
+
+    first_delay = limiter._reserve()
+    second_delay = limiter._reserve()
+
+    # One token per second: the 61st request waits ~1s, the 62nd ~2s
+    assert first_delay == pytest.approx(1.0, abs=0.1)
+    assert second_delay == pytest.approx(2.0, abs=0.1)
+
+
+def test_async_request(rate_limiter):
+    """Test that the async wrapper awaits the call and counts it."""
+
+    async def test_func(value):
+        return value
+
+    wrapped_func = rate_limiter.check_rate_limit_async(test_func)
+
+    assert asyncio.run(wrapped_func("success")) == "success"
+    assert rate_limiter.rpd_counter == 1
+
+
+def test_async_rate_limit_exceeded(rate_limiter):
+    """Test that the async wrapper enforces the daily limit."""
+
+    async def test_func():
+        return "success"
+
+    wrapped_func = rate_limiter.check_rate_limit_async(test_func)
+    rate_limiter.rpd_counter = rate_limiter.max_rpd
+
+    with pytest.raises(RuntimeError, match="Daily API request limit exceeded"):
+        asyncio.run(wrapped_func())
+
+
+def test_async_concurrent_requests_respect_daily_limit(rate_limiter):
+    """Test that coroutines awaiting at once never exceed the daily budget."""
+
+    async def test_func():
+        await asyncio.sleep(0)
+        return "success"
+
+    wrapped_func = rate_limiter.check_rate_limit_async(test_func)
+    calls = 3 * rate_limiter.max_rpd
+
+    async def run():
+        return await asyncio.gather(
+            *(wrapped_func() for _ in range(calls)), return_exceptions=True
+        )
+
+    results = asyncio.run(run())
+
+    assert results.count("success") == rate_limiter.max_rpd
+    assert all(
+        isinstance(result, RuntimeError) for result in results if result != "success"
+    )
+    assert rate_limiter.rpd_counter == rate_limiter.max_rpd
@@ -1,85 +1,59 @@
 import json
-import unittest
+import pytest
 
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 from summarizers.summarizer import Summarizer
-from utils.file_utils import copy_file, delete_all_in_directory
-from config.settings import get_settings
-from utils.logging_config import get_logger, setup_logging
+from utils.logging_config import get_logger
 from tests.mocks.mock_llm import create_mock_llm
 from tests.mocks.mock_gemini_tokenizer import MockGeminiTokenizer
-
-setup_logging()
+from tests.conftest import EXPECTED_FEATURE_GATES
 
 logger = get_logger(__name__)
 
-# Clear settings cache to pick up new environment variables
-get_settings.cache_clear()
-settings = get_settings()
 
-data_dir = settings.directories.data_dir
-test_data_dir = settings.directories.test_data_dir
+@pytest.fixture(scope="module")
+def summarized_features(settings, module_data_dir, copy_mock_files):
+    # Mock data
+    copy_mock_files("correlated_feature_gate_table.json", "correlated.json")
 
-correlated_feature_gate_table_file = (
-    test_data_dir / "correlated_feature_gate_table.json"
-)
-correlated_file = test_data_dir / "correlated.json"
-summarized_features_file = data_dir / "summarized_features.json"
+    with patch(
+        "clients.local_llm_client.create_local_llm", side_effect=create_mock_llm
+    ), patch(
+        "utils.gemini_tokenizer.GeminiTokenizer", side_effect=MockGeminiTokenizer
+    ), patch(
+        "langchain_google_genai.ChatGoogleGenerativeAI"
+    ) as mock_chat_google_ai:
+        # Configure mock ChatGoogleGenerativeAI
+        mock_chat_google_ai.return_value.get_num_tokens.return_value = 100
 
+        summarizer = Summarizer(settings)
+        summarizer.summarize_feature_gates()
 
-class TestSummarizeFeatureGates(unittest.TestCase):
-    @classmethod
-    @patch("clients.local_llm_client.create_local_llm", side_effect=create_mock_llm)
-    @patch("utils.gemini_tokenizer.GeminiTokenizer", side_effect=MockGeminiTokenizer)
-    @patch("utils.gemini_tokenizer.ChatGoogleGenerativeAI")
-    def setUpClass(cls, mock_chat_google_ai, mock_create_llm, mock_tokenizer):
-        url = (
-            "https://amd64.origin.releases.ci.openshift.org/releasestream/"
-            "4-scos-stable/release/4.19.0-okd-scos.0"
-        )
-        cls.data_dir = data_dir
-        cls.correlated_table_file = cls.data_dir / "correlated_feature_gate_table.json"
-        cls.expected_feature_gates = set(
-            sorted(
-                {
-                    "CSIDriverSharedResource",
-                    "VSphereControlPlaneMachineSet",
-                    "VSphereStaticIPs",
-                    "GatewayAPI",
-                    "AdditionalRoutingCapabilities",
-                    "ConsolePluginContentSecurityPolicy",
-                    "MetricsCollectionProfiles",
-                    "OnClusterBuild",
-                    "OpenShiftPodSecurityAdmission",
-                    "RouteExternalCertificate",
-                    "ServiceAccountTokenNodeBinding",
-                    "CPMSMachineNamePrefix",
-                    "GatewayAPIController",
-                }
-            )
-        )
+    with open(module_data_dir / "summarized_features.json", "r") as f:
+        return json.load(f)
 
-        delete_all_in_directory(data_dir)
 
-        # Mock data
-        copy_file(src_path=correlated_feature_gate_table_file, dest_dir=data_dir)
-        copy_file(src_path=correlated_file, dest_dir=data_dir)
+def test_summarize_feature_gates(summarized_features):
+    result = summarized_features
+    assert isinstance(result, dict)
+    assert EXPECTED_FEATURE_GATES.issubset(set(result.keys()))
+    assert len(result) > 0
+    assert all(isinstance(k, str) for k in result.keys())
+    assert all(isinstance(v, str) for v in result.values())
 
-        # Configure mock ChatGoogleGenerativeAI
-        mock_chat_google_ai.return_value.get_num_tokens.return_value = 100
 
-        summarizer = Summarizer(settings)
-        summarizer.summarize_feature_gates()
+def test_failed_feature_gates_are_written_as_none(settings, data_dir, copy_mock_files):
+    copy_mock_files("correlated_feature_gate_table.json")
+    chains = MagicMock()
+    chains.single_feature_gate_summary_chain.batch.side_effect = lambda inputs, **_: [
+        RuntimeError("LLM unavailable") for _ in inputs
+    ]
 
-        with open(summarized_features_file, "r") as f:
-            cls.summarized_features = json.load(f)
+    Summarizer(
+        settings, chains=chains, tokenizer=MockGeminiTokenizer()
+    ).summarize_feature_gates()
 
-    def test_summarize_feature_gates(self):
-        result = self.summarized_features
-        self.assertTrue(isinstance(result, dict))
-        self.assertTrue(self.expected_feature_gates.issubset(set(result.keys())))
-        self.assertTrue(isinstance(result, dict))
-        self.assertTrue(len(result) > 0)
-        self.assertTrue(all(isinstance(k, str) for k in result.keys()))
-        self.assertTrue(all(isinstance(v, str) for v in result.values()))
-        self.assertTrue(all(isinstance(k, str) for k in result.keys()))
+    with open(data_dir / "summarized_features.json", "r") as f:
+        result = json.load(f)
+    assert EXPECTED_FEATURE_GATES.issubset(set(result.keys()))
+    assert all(v is None for v in result.values())
@@ -1,198 +1,205 @@
 """Tests for the Summarizer class."""
 
-import os
 import json
+import shutil
 import pytest
-from unittest.mock import patch, MagicMock
-from summarizers.summarizer import Summarizer, MapReduceSummarizer
-from utils.logging_config import get_logger, setup_logging
-from utils.file_utils import delete_all_in_directory, copy_file
-from tests.mocks.mock_llm import create_mock_llm
+from unittest.mock import MagicMock
+from chains.chains import Chains
+from summarizers.summarizer import CHARS_PER_TOKEN, Summarizer, MapReduceSummarizer
+from utils.logging_config import get_logger
 from tests.mocks.mock_chains import MockChains
-from tests.mocks.mock_gemini_tokenizer import MockGeminiTokenizer
 from tests.mocks.mock_rate_limiter import MockRateLimiter
 from config.settings import get_settings
 
-setup_logging()
 logger = get_logger(__name__)
 
-# Clear settings cache to pick up new environment variables
-get_settings.cache_clear()
 settings = get_settings()
-data_dir = settings.directories.data_dir
 test_data_dir = settings.directories.test_data_dir
 mock_correlated_file = test_data_dir / "correlated.json"
-dummy_correlated_file = data_dir / "correlated.json"
+
+# Character count above which the mock tokenizer forces chunking
+CHUNK_THRESHOLD = 50
+
+# Text of every response from the mock LLM behind the real chains
+MOCK_LLM_RESPONSE = "Mock response with proper formatting"
+
+# Correlated data written by tests, encoded once at import time
+TEST_PAYLOADS = {
+    name: json.dumps(data).encode()
+    for name, data in {
+        "projects": {
+            "Project1": {
+                "Epic1": {"description": "A" * CHUNK_THRESHOLD},
+                "Story1": {"description": "Story description"},
+            },
+            "Project2": {"Epic2": {"description": "B" * CHUNK_THRESHOLD}},
+        },
+    }.items()
+}
+
+
+pytestmark = pytest.mark.usefixtures("mock_llm_clients")
+
+
+def failing_invoke(message):
+    """Return a chain ``invoke`` replacement that always raises ``message``."""
+
+    def _raise(*args, **kwargs):
+        raise Exception(message)
+
+    return _raise
+
+
+@pytest.fixture(scope="module", autouse=True)
+def seeded_data_dir(module_data_dir):
+    """Seed the module's data directory once with the mock correlated file."""
+    shutil.copy(mock_correlated_file, module_data_dir)
+    return module_data_dir
 
 
 @pytest.fixture(autouse=True)
-def mock_dependencies():
-    """Mock all external dependencies."""
-    mock_tokenizer = MockGeminiTokenizer()
-    with patch(
-        "clients.local_llm_client.create_local_llm", side_effect=create_mock_llm
-    ), patch(
-        "clients.gemini_llm_client.create_gemini_llm", side_effect=create_mock_llm
-    ), patch(
-        "utils.gemini_tokenizer.GeminiTokenizer", return_value=mock_tokenizer
-    ):
-        yield
+def small_chunk_threshold(mock_tokenizer, monkeypatch):
+    """Make tiny payloads exceed the mock tokenizer's limit to force chunking."""
+    monkeypatch.setattr(mock_tokenizer, "chunk_threshold", CHUNK_THRESHOLD)
 
 
 @pytest.fixture(autouse=True)
-def setup_test_environment():
-    """Set up test environment before each test."""
-    settings.processing.summarize_enabled = True
-    settings.api.llm_provider = "local"  # Use local mock LLM
-    delete_all_in_directory(data_dir)
-    copy_file(src_path=mock_correlated_file, dest_dir=data_dir)
-    yield
+def setup_test_environment(monkeypatch):
+    """Give each test the default settings; monkeypatch restores any changes."""
+    monkeypatch.setattr(settings.processing, "summarize_enabled", True)
+    monkeypatch.setattr(settings.api, "llm_provider", "local")  # Use local mock LLM
 
 
 class TestSummarizer:
     """Test cases for Summarizer class."""
 
-    def test_summarize_disabled(self):
+    def test_summarize_disabled(self, data_dir, monkeypatch):
         """Test that summarization is skipped when disabled."""
-        settings.processing.summarize_enabled = False
+        monkeypatch.setattr(settings.processing, "summarize_enabled", False)
         summarizer = Summarizer(settings)
         summarizer.summarize()
-        assert not os.path.exists(data_dir / "summaries")
+        assert not (data_dir / "summaries").exists()
 
-    def test_summarize_enabled(self):
+    def test_summarize_enabled(self, data_dir):
         """Test that summarization works when enabled."""
-        setup_dummy_test_data()
+        (data_dir / "correlated.json").write_bytes(TEST_PAYLOADS["projects"])
         summarizer = Summarizer(settings)
         summarizer.summarize()
 
-        # Check that summary.txt was created in data directory
-        summary_file_path = data_dir / "summary.txt"
-        assert os.path.exists(summary_file_path), "summary.txt was not created"
+        # Check that the summary was created in data directory
+        summary_file_path = settings.file_paths.summary_file_path
+        assert summary_file_path.exists(), "summary was not created"
 
-    def test_summarize(self):
+    def test_summarize(self, data_dir):
         """Test basic summarization functionality."""
         summarizer = Summarizer(settings)
         summarizer.summarize()
 
-        # Check that summary.txt was created in data directory
-        summary_file_path = data_dir / "summary.txt"
-        assert os.path.exists(summary_file_path), "summary.txt was not created"
-
-        with open(summary_file_path, "r") as f:
-            summary_content = f.read()
+        # Check that the summary was created in data directory
+        summary_file_path = settings.file_paths.summary_file_path
+        assert summary_file_path.exists(), "summary was not created"
 
-        assert len(summary_content.strip()) > 10, "summary.txt is empty"
+        summary_content = summary_file_path.read_text()
 
+        assert len(summary_content.strip()) > 10, "summary is empty"
 
-class TestMapReduceSummarizer:
-    """Test cases for MapReduce summarizer functionality."""
+    def test_short_text_skips_tokenizer(self, monkeypatch):
+        """Test that text too short to exceed the chunk size is not tokenized."""
+        monkeypatch.setattr(settings.api, "llm_provider", "gemini")
+        tokenizer = MagicMock()
+        tokenizer.count_tokens.return_value = 0
+        summarizer = Summarizer(
+            settings, chains=MockChains(settings), tokenizer=tokenizer
+        )
 
-    def test_summarizer_initialization(self):
-        """Test that MapReduceChainManager is properly initialized."""
-        summarizer = Summarizer(settings)
-        assert isinstance(summarizer.map_reducer, MapReduceSummarizer)
+        assert summarizer.is_chunk_size_valid("short text")
+        tokenizer.count_tokens.assert_not_called()
 
-    def test_summarization_with_reduce(self):
-        """Test summarization with reduce enabled."""
-        settings.processing.reduce_enabled = True
-        test_data = {
-            "Project1": {
-                "Epic1": {"description": "A" * 10000},
-                "Story1": {"description": "Story description"},
-            },
-            "Project2": {"Epic2": {"description": "B" * 10000}},
-        }
-        with open(dummy_correlated_file, "w") as f:
-            json.dump(test_data, f)
+        assert summarizer.is_chunk_size_valid("x" * summarizer.chunk_size)
+        tokenizer.count_tokens.assert_called_once()
 
-        summarizer = Summarizer(settings)
-        summarizer.summarize()
 
-        # Verify the summary was created with proper structure
-        summary_file_path = data_dir / "summary.txt"
-        assert os.path.exists(summary_file_path)
+class TestMapReduceSummarizer:
+    """Test cases for MapReduce summarizer functionality."""
 
-        with open(summary_file_path, "r") as f:
-            content = f.read()
+    @pytest.fixture(scope="class")
+    def summarizer(self):
+        """Summarizer shared by the tests that only vary their inputs."""
+        summarizer = Summarizer(settings, chains=MockChains(settings))
+        summarizer.map_reducer.reduce_enabled = True
+        return summarizer
 
-        assert "Mock summary" in content
+    def test_summarizer_initialization(self, summarizer):
+        """Test that MapReduceChainManager is properly initialized."""
+        assert isinstance(summarizer.map_reducer, MapReduceSummarizer)
 
-    def test_summarization_without_reduce(self):
-        """Test summarization with reduce disabled."""
-        settings.processing.reduce_enabled = False
-        test_data = {
-            "Project1": {
-                "Epic1": {"description": "A" * 10000},
-                "Story1": {"description": "Story description"},
-            },
-            "Project2": {"Epic2": {"description": "B" * 10000}},
-        }
-        with open(dummy_correlated_file, "w") as f:
-            json.dump(test_data, f)
+    @pytest.mark.parametrize("provider", ["local", "gemini"])
+    @pytest.mark.parametrize("reduce_enabled", [True, False])
+    def test_summarization(self, data_dir, monkeypatch, provider, reduce_enabled):
+        """Test summarization for each provider with reduce enabled and disabled."""
+        monkeypatch.setattr(settings.api, "llm_provider", provider)
+        monkeypatch.setattr(settings.api, "google_api_key", "test-key")
+        monkeypatch.setattr(settings.processing, "reduce_enabled", reduce_enabled)
+        (data_dir / "correlated.json").write_bytes(TEST_PAYLOADS["projects"])
 
         summarizer = Summarizer(settings)
         summarizer.summarize()
 
         # Verify the summary was created with proper structure
-        summary_file_path = data_dir / "summary.txt"
-        assert os.path.exists(summary_file_path)
+        summary_file_path = settings.file_paths.summary_file_path
+        assert summary_file_path.exists()
 
-        with open(summary_file_path, "r") as f:
-            content = f.read()
+        content = summary_file_path.read_text()
 
-        assert "Mock summary" in content
+        assert "## Project1" in content
+        assert "## Project2" in content
+        assert MOCK_LLM_RESPONSE in content
 
     def test_error_handling(self):
         """Test error handling during summarization."""
         # Create a failing mock chain
         failing_chain = MockChains(settings)
-        failing_chain.parameterized_summarize_chain.invoke = lambda x: (
-            _ for _ in ()
-        ).throw(Exception("Test error"))
+        failing_chain.summary_chain.invoke = failing_invoke("Test error")
 
         summarizer = Summarizer(settings, chains=failing_chain)
-        with pytest.raises(RuntimeError):
+        with pytest.raises(
+            ValueError, match="No projects were successfully summarized"
+        ):
             summarizer.summarize()
 
-    def test_debug_output(self):
+    def test_debug_output(self, data_dir, monkeypatch):
         """Test debug output generation."""
-        settings.processing.debug = True
-        test_data = {"test": "data"}
-        with open(dummy_correlated_file, "w") as f:
-            json.dump(test_data, f)
+        monkeypatch.setattr(settings.processing, "debug", True)
+        (data_dir / "correlated.json").write_bytes(TEST_PAYLOADS["projects"])
 
         summarizer = Summarizer(settings)
         summarizer.summarize()
 
         # Verify summary file was created
-        summary_file_path = data_dir / "summary.txt"
-        assert os.path.exists(summary_file_path)
+        summary_file_path = settings.file_paths.summary_file_path
+        assert summary_file_path.exists()
 
-        with open(summary_file_path, "r") as f:
-            content = f.read()
+        content = summary_file_path.read_text()
 
-        assert "Mock summary" in content
+        assert MOCK_LLM_RESPONSE in content
 
-    def test_json_splitting(self):
+    def test_json_splitting(self, summarizer):
         """Test JSON object splitting functionality."""
-        settings.processing.reduce_enabled = True
-        # Test data with various JSON patterns
+        # JSON chunks are sized by serialized length; each field below is
+        # close to that limit, so the object cannot fit in one chunk
+        field_size = summarizer.map_reducer.chunk_size * CHARS_PER_TOKEN // 2
         test_data = {
             "large_object": {
-                "field1": "A" * 5000,  # Large text field
-                "field2": ["B" * 1000] * 5,  # Large array
+                "field1": "A" * field_size,  # Large text field
+                "field2": ["B" * (field_size // 5)] * 5,  # Large array
                 "field3": {  # Nested object
-                    "nested1": "C" * 3000,
-                    "nested2": ["D" * 500] * 6,
+                    "nested1": "C" * field_size,
+                    "nested2": ["D" * (field_size // 6)] * 6,
                 },
             },
             "small_object": {"field1": "Small text", "field2": [1, 2, 3]},
         }
 
-        summarizer = Summarizer(settings)
-        # Mock the tokenizer to avoid API calls
-        mock_tokenizer = MockGeminiTokenizer()
-        summarizer.map_reducer.tokenizer = mock_tokenizer
         result = summarizer.map_reducer.process_text("test", test_data)
 
         # Verify the structure of the result
@@ -207,10 +214,9 @@ class TestMapReduceSummarizer:
         assert result["metadata"]["reduce_enabled"] is True
         assert result["metadata"]["total_chunks"] > 1
 
-    def test_markdown_formatting(self):
+    def test_markdown_formatting(self, data_dir, monkeypatch):
         """Test proper markdown formatting in summaries."""
-        settings.processing.reduce_enabled = True
-        settings.api.jira_server = "https://jira.example.com"
+        monkeypatch.setattr(settings.api, "jira_server", "https://jira.example.com")
         test_data = {
             "Project1": {
                 "epics": [
@@ -237,56 +243,35 @@ class TestMapReduceSummarizer:
             }
         }
 
-        summarizer = Summarizer(settings)
-        result = summarizer.summarize_projects(test_data)
-
-        # Verify markdown structure
-        lines = result.split("\n")
-
-        # Check project header
-        assert any(line.startswith("## Project1") for line in lines)
-
-        # Check JIRA links in headers
-        assert any(
-            "[EPIC-1](https://jira.example.com/browse/EPIC-1)" in line for line in lines
-        )
-        assert any(
-            "[EPIC-2](https://jira.example.com/browse/EPIC-2)" in line for line in lines
-        )
-        assert any(
-            "[STORY-1](https://jira.example.com/browse/STORY-1)" in line
-            for line in lines
-        )
-
-        # Check epic links
-        assert any(
-            "[EPIC-2](https://jira.example.com/browse/EPIC-2)" in line for line in lines
-        )
-        assert any(
-            "[EPIC-1](https://jira.example.com/browse/EPIC-1)" in line for line in lines
-        )
+        (data_dir / "correlated.json").write_text(json.dumps(test_data))
 
-        # Check spacing
-        for i in range(len(lines) - 1):
-            if lines[i].startswith("#"):
-                # Headers should be followed by blank line
-                assert (
-                    lines[i + 1].strip() == ""
-                ), f"Header not followed by blank line: {lines[i]}"
+        # Echo the rendered project back as its summary, so the output shows
+        # how project data and JIRA keys end up in the written summary
+        chains = MockChains(settings)
+        chains.summary_chain.invoke = lambda inputs, *args, **kwargs: inputs["value"]
+        result = Summarizer(settings, chains=chains).summarize()
 
-    def test_mixed_content_handling(self):
+        # Each project starts with its own header, directly followed by its summary
+        lines = result.split("\n")
+        assert lines[0] == "## Project1"
+        assert lines[1].strip()
+
+        # Check JIRA links in headers and epic links
+        links = [
+            f"[{key}](https://jira.example.com/browse/{key})"
+            for key in ("EPIC-1", "EPIC-2", "STORY-1")
+        ]
+        missing_links = [link for link in links if link not in result]
+        assert not missing_links, f"Missing JIRA links: {missing_links}"
+
+    def test_mixed_content_handling(self, summarizer):
         """Test handling of mixed JSON and text content."""
-        settings.processing.reduce_enabled = True
         test_data = {
             "text_field": "Regular text content",
-            "json_field": {"nested": {"description": "A" * 5000}},  # Large text in JSON
-            "array_field": ["B" * 1000] * 5,  # Large array
+            "json_field": {"nested": {"description": "A" * 50}},  # Large text in JSON
+            "array_field": ["B" * 10] * 5,  # Large array
         }
 
-        summarizer = Summarizer(settings)
-        # Mock the tokenizer to avoid API calls
-        mock_tokenizer = MockGeminiTokenizer()
-        summarizer.map_reducer.tokenizer = mock_tokenizer
         result = summarizer.map_reducer.process_text("test", test_data)
 
         # Verify proper handling of different content types
@@ -296,10 +281,8 @@ class TestMapReduceSummarizer:
             assert "chunk_index" in summary["metadata"]
             assert "total_chunks" in summary["metadata"]
 
-    def test_empty_content_handling(self):
+    def test_empty_content_handling(self, summarizer):
         """Test handling of empty or None content."""
-        summarizer = Summarizer(settings)
-
         # Test with None
         result = summarizer.map_reducer.process_text("test", None)
         assert result["final_summary"] == ""
@@ -315,23 +298,16 @@ class TestMapReduceSummarizer:
         assert result["final_summary"] == ""
         assert len(result["chunk_summaries"]) == 0
 
-    def test_reduce_chain_error_handling(self):
+    def test_reduce_chain_error_handling(self, monkeypatch):
         """Test error handling in reduce chain."""
-        settings.processing.reduce_enabled = True
+        monkeypatch.setattr(settings.processing, "reduce_enabled", True)
         failing_chains = MockChains(settings)
 
         # Make reduce chain fail
-        def failing_invoke(*args, **kwargs):
-            raise Exception("Reduce chain error")
-
-        failing_chains.reduce_chain.invoke = failing_invoke
+        failing_chains.reduce_chain.invoke = failing_invoke("Reduce chain error")
 
         summarizer = Summarizer(settings, chains=failing_chains)
-        test_data = {"field": "A" * 5000}  # Force chunking
-
-        # Mock the tokenizer to avoid API calls
-        mock_tokenizer = MockGeminiTokenizer()
-        summarizer.map_reducer.tokenizer = mock_tokenizer
+        test_data = {"field": "A" * 50}  # Force chunking
 
         result = summarizer.map_reducer.process_text("test", test_data)
         assert "Error" in result["final_summary"]
@@ -341,17 +317,10 @@ class TestMapReduceSummarizer:
         failing_chains = MockChains(settings)
 
         # Make map chain fail
-        def failing_invoke(*args, **kwargs):
-            raise Exception("Map chain error")
-
-        failing_chains.map_chain.invoke = failing_invoke
+        failing_chains.map_chain.invoke = failing_invoke("Map chain error")
 
         summarizer = Summarizer(settings, chains=failing_chains)
-        test_data = {"field": "A" * 5000}  # Force chunking
-
-        # Mock the tokenizer to avoid API calls
-        mock_tokenizer = MockGeminiTokenizer()
-        summarizer.map_reducer.tokenizer = mock_tokenizer
+        test_data = {"field": "A" * 50}  # Force chunking
 
         result = summarizer.map_reducer.process_text("test", test_data)
         assert any(
@@ -363,11 +332,10 @@ class TestRateLimiting:
     """Test cases for rate limiting functionality."""
 
     @pytest.fixture(autouse=True)
-    def setup_rate_limiting(self):
+    def setup_rate_limiting(self, monkeypatch):
         """Set up rate limiting test environment."""
-        settings.api.max_requests_per_day = 2  # Set low limit for testing
-        delete_all_in_directory(data_dir)
-        copy_file(src_path=mock_correlated_file, dest_dir=data_dir)
+        # Set low limit for testing
+        monkeypatch.setattr(settings.api, "max_requests_per_day", 2)
         self.mock_chains = MockChains(settings)
         self.rate_limiter = MockRateLimiter(settings)
         yield
@@ -396,11 +364,11 @@ class TestRateLimiting:
 
     def test_rate_limit_on_failure(self):
         """Test that rate limit counter doesn't increment on failure."""
-        failing_chains = MockChains(settings)
-        failing_chains.llm_client.rate_limiter = self.rate_limiter
-        failing_chains.llm_client.rate_limiter.should_fail = True
+        chains = Chains(settings)
+        chains.llm_client.rate_limiter = self.rate_limiter
+        self.rate_limiter.should_fail = True
 
-        summarizer = Summarizer(settings, chains=failing_chains)
+        summarizer = Summarizer(settings, chains=chains)
         assert self.rate_limiter.rpd_counter == 0  # Start with 0
 
         # Call should fail but not increment counter
@@ -408,28 +376,35 @@ class TestRateLimiting:
             summarizer._summarize("test", "value")
         assert self.rate_limiter.rpd_counter == 0  # Should still be 0
 
+        # Map-reduce goes through LLMClient.ainvoke; a failed chunk is
+        # recorded in place of its summary and is not counted either
+        result = summarizer.map_reducer.process_text("test", "Some text")
+        assert result["chunk_summaries"]
+        assert all(
+            "Test rate limit error" in summary["content"]
+            for summary in result["chunk_summaries"]
+        )
+        assert self.rate_limiter.rpd_counter == 0
+
     def test_rate_limit_across_methods(self):
         """Test that rate limit applies across different methods."""
-        self.mock_chains.llm_client.rate_limiter = self.rate_limiter
-        summarizer = Summarizer(settings, chains=self.mock_chains)
+        chains = Chains(settings)
+        chains.llm_client.rate_limiter = self.rate_limiter
+        summarizer = Summarizer(settings, chains=chains)
+        summarizer.map_reducer.reduce_enabled = False
 
-        # Use up limit with first call
+        # Use up limit with a synchronous call
         summarizer._summarize("test1", "value1")
         assert self.rate_limiter.rpd_counter == 1
 
-        # Use up remaining limit with second call
-        summarizer._summarize("test2", "value2")
+        # Use up remaining limit with a single-chunk map-reduce call
+        result = summarizer.map_reducer.process_text("test2", "value2")
+        assert MOCK_LLM_RESPONSE in result["final_summary"]
         assert self.rate_limiter.rpd_counter == 2
 
-        # Both subsequent calls should fail
-        with pytest.raises(RuntimeError):
+        # Both paths are now refused
+        with pytest.raises(RuntimeError, match="Daily API request limit exceeded"):
             summarizer._summarize("test3", "value3")
-        with pytest.raises(RuntimeError):
-            summarizer._summarize("test4", "value4")
-
-
-def setup_dummy_test_data():
-    """Set up dummy test data."""
-    test_data = {"test": "data"}
-    with open(dummy_correlated_file, "w") as f:
-        json.dump(test_data, f)
+        result = summarizer.map_reducer.process_text("test4", "value4")
+        assert "Daily API request limit exceeded" in result["final_summary"]
+        assert self.rate_limiter.rpd_counter == 2
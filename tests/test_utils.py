@@ -0,0 +1,65 @@
+"""Tests for the general utilities."""
+
+import asyncio
+from pathlib import Path
+from utils.utils import (
+    _keyword_pattern,
+    contains_valid_keywords,
+    is_valid_url,
+    run_async,
+)
+from utils.parser_utils import load_html
+
+
+def test_is_valid_url_accepts_http_urls():
+    """Test that http(s) URLs with a host are accepted."""
+    assert is_valid_url("https://github.com/openshift/api/pull/1234")
+    assert is_valid_url("HTTP://example.com")
+    assert not is_valid_url("ftp://example.com/file")
+    assert not is_valid_url("https://")
+
+
+def test_is_valid_url_accepts_local_file_paths(tmp_path):
+    """Test that existing local files are accepted as str or Path."""
+    page = tmp_path / "release_page.html"
+    page.write_text("<html></html>")
+
+    assert is_valid_url(page)
+    assert is_valid_url(str(page))
+    assert not is_valid_url(Path(tmp_path / "missing.html"))
+
+
+def test_load_html_reads_local_path(tmp_path):
+    """Test that a local page can be loaded from a Path."""
+    page = tmp_path / "release_page.html"
+    page.write_text("<html></html>", encoding="utf-8")
+
+    assert load_html(page) == "<html></html>"
+
+
+async def _double(value):
+    await asyncio.sleep(0)
+    return await asyncio.to_thread(lambda: value * 2)
+
+
+def test_run_async_from_sync_code():
+    """Test that a coroutine is run to completion from synchronous code."""
+    assert run_async(_double(21), max_workers=2) == 42
+
+
+def test_run_async_inside_running_loop():
+    """Test that run_async also works when an event loop is already running."""
+
+    async def caller():
+        return run_async(_double(21), max_workers=2)
+
+    assert asyncio.run(caller()) == 42
+
+
+def test_keyword_pattern_orders_longest_first():
+    """Test that keywords are matched longest first, ties alphabetically."""
+    pattern = _keyword_pattern(("fix", "Bug", "bugfix", "pre"))
+    assert pattern.pattern == "bugfix|bug|fix|pre"
+
+    assert not contains_valid_keywords(["A BugFix release"], ["fix", "bugfix"])
+    assert contains_valid_keywords(["New feature", None], ["fix", "bugfix"])
@@ -3,23 +3,44 @@ Advanced text chunking utilities optimized for Gemini 1.5 Pro API.
 Implements accurate token counting, rate limiting, and semantic chunking using MapReduce.
 """
 
-from langchain_google_genai import ChatGoogleGenerativeAI
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Hashable, List
 from utils.logging_config import get_logger
+from clients.gemini_llm_client import get_shared_gemini_llm
 from config.settings import AppSettings
 
 logger = get_logger(__name__)
 
+# Token counts cached per tokenizer, and the text length above which the cache
+# keys on a digest so it does not pin whole chunks in memory
+TOKEN_COUNT_CACHE_SIZE = 8192
+TOKEN_COUNT_CACHE_KEY_MAX_CHARS = 1024
+
 
 class GeminiTokenizer:
     """Accurate token counter for Gemini models using the official tokenizer"""
 
     def __init__(self, settings: AppSettings):
-        # Initialize Gemini model for token counting
-        self.model = ChatGoogleGenerativeAI(
-            model=settings.api.gemini_model,
-            google_api_key=settings.api.google_api_key,
-            temperature=0.0,
-        )
+        self.max_workers = settings.api.max_concurrency
+
+        # Token counting uses the same chat model as the Gemini chains, so
+        # reuse the shared instance instead of constructing a second client
+        self.model = get_shared_gemini_llm(settings.api)
+
+        # The splitters re-measure the same chunks several times; memoize per
+        # text so repeats skip the tokenizer round trip
+        self._token_counts: OrderedDict[Hashable, int] = OrderedDict()
+        self._token_counts_lock = threading.Lock()
+
+    @staticmethod
+    def _cache_key(text: str) -> Hashable:
+        """Key short texts by themselves and long ones by a 16-byte digest."""
+        if len(text) <= TOKEN_COUNT_CACHE_KEY_MAX_CHARS:
+            return text
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
 
     def count_tokens(self, text: str) -> int:
         """
@@ -31,4 +52,42 @@ class GeminiTokenizer:
         Returns:
             Number of tokens in the text
         """
-        return self.model.get_num_tokens(text)
+        key = self._cache_key(text)
+        with self._token_counts_lock:
+            count = self._token_counts.get(key)
+            if count is not None:
+                self._token_counts.move_to_end(key)
+                return count
+
+        # Count outside the lock so concurrent batch requests are not
+        # serialized behind one tokenizer round trip
+        count = self.model.get_num_tokens(text)
+
+        with self._token_counts_lock:
+            self._token_counts[key] = count
+            if len(self._token_counts) > TOKEN_COUNT_CACHE_SIZE:
+                self._token_counts.popitem(last=False)
+        return count
+
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """
+        Get token counts for several texts at once
+
+        Each distinct text is counted once, and the tokenizer requests for
+        them run concurrently instead of one round trip after another.
+
+        Args:
+            texts: Input texts to count tokens for
+
+        Returns:
+            Number of tokens in each text, in input order
+        """
+        unique_texts = list(dict.fromkeys(texts))
+        if len(unique_texts) <= 1:
+            return [self.count_tokens(text) for text in texts]
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(unique_texts))
+        ) as pool:
+            counts = dict(zip(unique_texts, pool.map(self.count_tokens, unique_texts)))
+        return [counts[text] for text in texts]
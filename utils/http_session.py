@@ -16,7 +16,7 @@ import requests
 import threading
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 from utils.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -34,7 +34,12 @@ class HTTPSessionManager:
     """
 
     def __init__(self):
+        # Base URL -> session, for the lock-free lookup and for stats
         self._sessions: Dict[str, requests.Session] = {}
+        # Pool/retry configuration -> session. Base URLs with the same
+        # configuration share one session and adapter; urllib3 already keeps
+        # a separate connection pool per host inside it.
+        self._shared_sessions: Dict[Tuple, requests.Session] = {}
         self._lock = threading.Lock()
 
     def get_session(
@@ -60,19 +65,37 @@ class HTTPSessionManager:
         Returns:
             Configured requests.Session with connection pooling
         """
+        # Fast path without the lock: dict.get is atomic, and once created a
+        # session is never replaced, only dropped by close_all_sessions
+        session = self._sessions.get(base_url)
+        if session is not None:
+            return session
+
         with self._lock:
-            if base_url not in self._sessions:
-                session = self._create_session(
-                    pool_connections=pool_connections,
-                    pool_maxsize=pool_maxsize,
-                    max_retries=max_retries,
-                    backoff_factor=backoff_factor,
-                    timeout=timeout,
+            # Re-check: another thread may have created it while we waited
+            session = self._sessions.get(base_url)
+            if session is None:
+                config = (
+                    pool_connections,
+                    pool_maxsize,
+                    max_retries,
+                    backoff_factor,
+                    timeout,
                 )
+                session = self._shared_sessions.get(config)
+                if session is None:
+                    session = self._create_session(
+                        pool_connections=pool_connections,
+                        pool_maxsize=pool_maxsize,
+                        max_retries=max_retries,
+                        backoff_factor=backoff_factor,
+                        timeout=timeout,
+                    )
+                    self._shared_sessions[config] = session
+                    logger.debug(f"Created new HTTP session for {base_url}")
                 self._sessions[base_url] = session
-                logger.debug(f"Created new HTTP session for {base_url}")
 
-            return self._sessions[base_url]
+            return session
 
     def _create_session(
         self,
@@ -125,10 +148,11 @@ class HTTPSessionManager:
     def close_all_sessions(self):
         """Close all active sessions and clear the cache."""
         with self._lock:
-            for base_url, session in self._sessions.items():
+            for session in self._shared_sessions.values():
                 session.close()
-                logger.debug(f"Closed HTTP session for {base_url}")
+            logger.debug(f"Closed HTTP sessions for {list(self._sessions)}")
             self._sessions.clear()
+            self._shared_sessions.clear()
 
     def get_session_info(self) -> Dict[str, int]:
         """
@@ -139,7 +163,7 @@ class HTTPSessionManager:
         """
         with self._lock:
             return {
-                "active_sessions": len(self._sessions),
+                "active_sessions": len(self._shared_sessions),
                 "session_urls": list(self._sessions.keys()),
             }
 
@@ -157,6 +181,11 @@ def get_session_manager() -> HTTPSessionManager:
         HTTPSessionManager instance
     """
     global _session_manager
+    # Double-checked so the lock is only taken while the manager is created
+    manager = _session_manager
+    if manager is not None:
+        return manager
+
     with _manager_lock:
         if _session_manager is None:
             _session_manager = HTTPSessionManager()
@@ -1,12 +1,12 @@
 import sys
+import atexit
 import logging
+import queue
+import threading
 import time
-from pathlib import Path
 from functools import wraps
 from config.settings import get_settings
 
-settings = get_settings()
-
 
 def get_logger(name=None):
     """Get a logger for the given name/module."""
@@ -16,7 +16,9 @@ def get_logger(name=None):
 def setup_logging(level="INFO"):
     # Check DEBUG environment variable first
 
-    debug_enabled = settings.processing.debug
+    # Resolved here rather than at import so that importing get_logger does
+    # not build the settings, and a cleared settings cache is picked up
+    debug_enabled = get_settings().processing.debug
 
     if level == "DEBUG" or debug_enabled:
         log_level = logging.DEBUG
@@ -27,7 +29,7 @@ def setup_logging(level="INFO"):
     else:
         log_level = logging.INFO
 
-    log_file = Path("logs") / "app.log"
+    log_file = get_settings().directories.logs_dir / "app.log"
     logger = logging.getLogger()
     logger.setLevel(log_level)
 
@@ -41,7 +43,7 @@ def setup_logging(level="INFO"):
     ch.setFormatter(ch_formatter)
 
     # File handler - always log DEBUG level to file
-    log_file.parent.mkdir(exist_ok=True)
+    log_file.parent.mkdir(parents=True, exist_ok=True)
     fh = logging.FileHandler(log_file)
     fh.setLevel(logging.DEBUG)
     fh.setFormatter(ch_formatter)
@@ -57,32 +59,21 @@ def clean_escape_characters(text):
     if not isinstance(text, str):
         text = str(text)
 
-    # Replace carriage return + line feed with just line feed
-    text = text.replace("\r\n", "\n")
-
-    # Replace standalone carriage returns with line feeds
-    text = text.replace("\r", "\n")
+    # Replace carriage returns (CRLF first) with line feeds; each replace is a
+    # full copy of the text, so skip them when the character is absent
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
 
     # Replace common escape sequences
-    text = text.replace("\\n", "\n")
-    text = text.replace("\\r", "\n")
-    text = text.replace("\\t", "\t")
+    if "\\" in text:
+        text = text.replace("\\n", "\n").replace("\\r", "\n").replace("\\t", "\t")
 
     # Clean up excessive whitespace but preserve intentional formatting
-    lines = text.split("\n")
-    cleaned_lines = []
-
-    for line in lines:
-        # Remove excessive spaces but keep some formatting
-        cleaned_line = " ".join(line.split())
-        cleaned_lines.append(cleaned_line)
+    cleaned_text = "\n".join([" ".join(line.split()) for line in text.split("\n")])
 
-    # Join lines back together
-    cleaned_text = "\n".join(cleaned_lines)
-
-    # Remove any remaining problematic characters
-    cleaned_text = cleaned_text.replace("\x00", "")  # null characters
-    cleaned_text = cleaned_text.replace("\x1b", "")  # escape characters
+    # Remove any remaining problematic characters (null and escape characters)
+    if "\x00" in cleaned_text or "\x1b" in cleaned_text:
+        cleaned_text = cleaned_text.replace("\x00", "").replace("\x1b", "")
 
     return cleaned_text
 
@@ -106,25 +97,127 @@ def format_content_for_log(content):
 
         # Break very long lines at reasonable points
         if len(line) > 120:
-            words = line.split()
-            current_line = ""
-
-            for word in words:
-                if len(current_line + word) > 120:
-                    if current_line:
-                        formatted_lines.append(current_line.strip())
-                    current_line = word + " "
+            # Track the wrapped line's length instead of building and
+            # measuring a new string for every word
+            current_words = []
+            current_len = 0
+
+            for word in line.split():
+                if current_words and current_len + len(word) > 120:
+                    formatted_lines.append(" ".join(current_words))
+                    current_words = [word]
+                    current_len = len(word) + 1
                 else:
-                    current_line += word + " "
+                    current_words.append(word)
+                    current_len += len(word) + 1
 
-            if current_line:
-                formatted_lines.append(current_line.strip())
+            if current_words:
+                formatted_lines.append(" ".join(current_words))
         else:
             formatted_lines.append(line)
 
     return "\n".join(formatted_lines)
 
 
+_prompt_log_queue = queue.Queue()
+_prompt_log_writer = None
+_prompt_log_writer_lock = threading.Lock()
+
+
+def _render_prompt_log(timestamp, prompt, result):
+    """Render one prompt/result pair as a readable log record."""
+    formatted_prompt = format_content_for_log(prompt)
+    formatted_result = format_content_for_log(result)
+    separator = "=" * 80
+    divider = "-" * 40
+
+    return (
+        f"{separator}\n"
+        f"PROMPT LOG - {timestamp}\n"
+        f"{separator}\n\n"
+        "PROMPT:\n"
+        f"{divider}\n"
+        f"{formatted_prompt}\n\n"
+        "RESULT:\n"
+        f"{divider}\n"
+        f"{formatted_result}\n\n"
+        f"{separator}\n"
+        "END OF LOG\n"
+        f"{separator}\n"
+    )
+
+
+def _write_prompt_logs():
+    """Drain queued prompt logs, writing each one to its own log file."""
+    while True:
+        # Block for the next record, then take everything already queued
+        # so a burst of calls is written together
+        batch = [_prompt_log_queue.get()]
+        while True:
+            try:
+                batch.append(_prompt_log_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        running = True
+        try:
+            for record in batch:
+                if record is None:
+                    running = False
+                    continue
+
+                logs_dir, timestamp, prompt, result = record
+                logs_dir.mkdir(parents=True, exist_ok=True)
+                # One readable file per call, named after its timestamp
+                with open(
+                    logs_dir / f"{timestamp}_prompt.log", "w", encoding="utf-8"
+                ) as log:
+                    log.write(_render_prompt_log(timestamp, prompt, result))
+        except Exception as e:
+            logging.getLogger(__name__).error(f"Failed to write prompt log: {e}")
+        finally:
+            for _ in batch:
+                _prompt_log_queue.task_done()
+
+        if not running:
+            return
+
+
+def _ensure_prompt_log_writer():
+    """Start the background prompt log writer thread if it is not running."""
+    global _prompt_log_writer
+
+    if _prompt_log_writer is not None:
+        return
+
+    with _prompt_log_writer_lock:
+        if _prompt_log_writer is None:
+            _prompt_log_writer = threading.Thread(
+                target=_write_prompt_logs, name="prompt-log-writer", daemon=True
+            )
+            _prompt_log_writer.start()
+            atexit.register(stop_prompt_log_writer)
+
+
+def flush_prompt_logs():
+    """Block until every queued prompt log has been written."""
+    _prompt_log_queue.join()
+
+
+def stop_prompt_log_writer():
+    """Write any queued prompt logs and stop the background writer thread."""
+    global _prompt_log_writer
+
+    with _prompt_log_writer_lock:
+        writer = _prompt_log_writer
+        if writer is None:
+            return
+        _prompt_log_queue.put(None)
+        writer.join()
+        _prompt_log_writer = None
+        atexit.unregister(stop_prompt_log_writer)
+
+
 def log_prompt(func):
     @wraps(func)
     def wrapper(*args, **kwargs):
@@ -135,36 +228,12 @@ def log_prompt(func):
             else "N/A"
         )
         timestamp = time.strftime("%Y%m%d-%H%M%S")
-        logs_dir = Path("logs")
-        logs_dir.mkdir(exist_ok=True)
-
-        # Create a readable log file with proper formatting
-        log_filename = logs_dir / f"{timestamp}_prompt.log"
-
-        with open(log_filename, "w", encoding="utf-8") as log:
-            log.write(f"{'='*80}\n")
-            log.write(f"PROMPT LOG - {timestamp}\n")
-            log.write(f"{'='*80}\n\n")
-
-            log.write("PROMPT:\n")
-            log.write("-" * 40 + "\n")
-
-            # Format and clean the prompt content
-            formatted_prompt = format_content_for_log(prompt)
-            log.write(formatted_prompt)
-
-            log.write("\n\n")
-            log.write("RESULT:\n")
-            log.write("-" * 40 + "\n")
-
-            # Format and clean the result content
-            formatted_result = format_content_for_log(result)
-            log.write(formatted_result)
 
-            log.write("\n\n")
-            log.write(f"{'='*80}\n")
-            log.write("END OF LOG\n")
-            log.write(f"{'='*80}\n")
+        # Formatting and file I/O happen on the background writer thread so
+        # the LLM call returns without waiting on disk
+        _ensure_prompt_log_writer()
+        logs_dir = get_settings().directories.logs_dir
+        _prompt_log_queue.put((logs_dir, timestamp, prompt, result))
 
         return result
 
@@ -1,34 +1,74 @@
+import os
 import re
 import json
-import requests
+import functools
 import markdown
 import pandas as pd
 from io import StringIO
 from pathlib import Path
+from urllib.parse import urlparse
 from bs4 import BeautifulSoup
 from markdown_it import MarkdownIt
+from utils.http_session import get_http_session
+from utils.utils import remove_urls
 from utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Read size for streamed page downloads
+HTML_CHUNK_SIZE = 1 << 16
 
-def load_html(source):
-    if Path(source).is_file():
+
+def load_html(source, timeout: float = 30):
+    # Local files may be given as Path objects
+    source = os.fspath(source)
+    # URLs are recognized by their scheme, so only other sources are stat'ed
+    if not source.startswith(("http://", "https://")) and Path(source).is_file():
         with open(source, "r", encoding="utf-8") as f:
             return f.read()
-    response = requests.get(source)
-    response.raise_for_status()
-    return response.text
+
+    # Reuse the pooled session for the host and stream the body so it is
+    # joined into a single buffer and decoded once
+    parsed = urlparse(source)
+    session = get_http_session(f"{parsed.scheme}://{parsed.netloc}")
+    with session.get(source, stream=True, timeout=timeout) as response:
+        response.raise_for_status()
+        body = b"".join(response.iter_content(chunk_size=HTML_CHUNK_SIZE))
+        return str(body, response.encoding or "utf-8", errors="replace")
+
+
+def parse_html_text(html: str) -> BeautifulSoup:
+    # lxml (already a requirement) is C-backed and much faster than the
+    # pure-Python html.parser
+    return BeautifulSoup(html, "lxml")
 
 
 def parse_html(source):
     html = load_html(source)
-    soup = BeautifulSoup(html, "html.parser")
+    soup = parse_html_text(html)
 
     return soup
 
 
-def parse_tables(soup) -> list[pd.DataFrame]:
+def parse_tables(html) -> list[pd.DataFrame]:
+    """
+    Parse every table in an HTML page into DataFrames.
+
+    Args:
+        html: Raw HTML text, or an already parsed BeautifulSoup. Raw text is
+            preferred since a soup has to be serialized back to HTML first.
+    """
+    # Parse every table in one read_html pass over the document rather than
+    # serializing and re-parsing each <table> on its own
+    try:
+        return pd.read_html(StringIO(html if isinstance(html, str) else str(html)))
+    except Exception as e:
+        if isinstance(e, ValueError) and "No tables found" in str(e):
+            return []
+        # One bad table fails the whole pass; fall back so only it is skipped
+        logger.debug(f"Parsing all tables at once failed, retrying per table: {e}")
+
+    soup = parse_html_text(html) if isinstance(html, str) else html
     tables = soup.find_all("table")
     dataframes = []
 
@@ -43,16 +83,28 @@ def parse_tables(soup) -> list[pd.DataFrame]:
     return dataframes
 
 
-def parse_markdown(md):
-    md = MarkdownIt()
-    tokens = md.parse(md)
-    result = []
-    for token in tokens:
-        result.append((token.type, token.tag, token.content))
+# Building the parser sets up its whole rule chain, so do it once
+_MD_PARSER = MarkdownIt()
+
+# Markdown results cached for repeated calls on the same page. Every entry
+# holds the whole text plus output of about the same size (tokens or HTML),
+# so keying on a digest would not make it small; only a few are kept
+MARKDOWN_CACHE_SIZE = 8
+
+
+@functools.lru_cache(maxsize=MARKDOWN_CACHE_SIZE)
+def _parse_markdown_cached(md_text):
+    tokens = _MD_PARSER.parse(md_text)
 
-    return result
+    return tuple((token.type, token.tag, token.content) for token in tokens)
 
 
+def parse_markdown(md_text):
+    # The cached tokens are shared, so hand each caller its own list
+    return list(_parse_markdown_cached(md_text))
+
+
+@functools.lru_cache(maxsize=MARKDOWN_CACHE_SIZE)
 def is_valid_markdown(md_text):
     try:
         html = markdown.markdown(md_text)
@@ -61,53 +113,132 @@ def is_valid_markdown(md_text):
         return False, str(e)
 
 
-def clean_md_text(text):
-    # Replace escaped characters with spaces
-    text = (
-        text.replace("\\r\\n", " ")
-        .replace("\\n", " ")
-        .replace("\\r", " ")
-        .replace("\u2026", "...")
-        .replace("\u00a0", " ")
-        .replace("\u201c", '"')
-        .replace("\u201d", '"')
-        .replace("\u2013", "-")
-        .replace("\u2014", "-")
-        .replace("\u2022", "*")
-    )
-
-    # Remove URLs (http, https, www)
-    text = re.sub(r"(https?://\S+|www\.\S+)", "", text)
+def _strip_wiki_links(text):
+    """
+    Convert [text|url] wiki links to their text.
 
-    # Remove Jira/Confluence markup
-    text = re.sub(r"\{color[^}]*\}.*?\{color\}", "", text)  # Remove color markup
-    text = re.sub(r"\{\*\}(.*?)\{\*\}", r"\1", text)  # Convert {*}text{*} to text
-    text = re.sub(r"\{\{([^}]*)\}\}", r"\1", text)  # Convert {{text}} to text
-    text = re.sub(r"\[([^|]*)\|[^\]]*\]", r"\1", text)  # Convert [text|url] to text
-    text = re.sub(r"_{color:[^}]*}[^{]*{color}_", "", text)  # Remove color formatting
+    Equivalent to re.sub(r"\\[([^|]*)\\|[^\\]]*\\]", r"\\1", text), but
+    linear: the regex rescans to the end of the text from every "[" once no
+    "]" is left, which happens whenever URL removal has eaten the closing
+    brackets.
+    """
+    parts = []
+    pos = 0
+    while (start := text.find("[", pos)) != -1:
+        bar = text.find("|", start + 1)
+        if bar == -1:
+            break
+        end = text.find("]", bar + 1)
+        # Every later "[" would need a "]" after this same "|", so stop here
+        if end == -1:
+            break
+        parts.append(text[pos:start])
+        parts.append(text[start + 1 : bar])
+        pos = end + 1
+
+    if not parts:
+        return text
+    parts.append(text[pos:])
+    return "".join(parts)
+
+
+def _strip_table_rows(text):
+    """
+    Drop lines that start and end with "|".
 
+    Stands in for re.sub(r"^\\s*\\|.*\\|\\s*$", "", text, flags=re.MULTILINE);
+    the lines are dropped rather than blanked, which is the same once
+    clean_md_text collapses whitespace. Most text has no such rows left
+    after the cell pass, so this usually returns after one scan.
+    """
+    if "|" not in text:
+        return text
+
+    lines = text.split("\n")
+    kept = [
+        line
+        for line in lines
+        if not (
+            len(stripped := line.strip()) > 1
+            and stripped[0] == "|"
+            and stripped[-1] == "|"
+        )
+    ]
+    if len(kept) == len(lines):
+        return text
+    return "\n".join(kept)
+
+
+def _substitute(pattern, replacement):
+    return functools.partial(pattern.sub, replacement)
+
+
+# Cleanup steps applied in order by clean_md_text, compiled once at import
+_CLEAN_MD_STEPS = [
+    # Remove URLs (http, https, www)
+    remove_urls,
+    # Remove Jira/Confluence markup: color markup, {*}text{*} and {{text}}
+    # to text, [text|url] to text, and color formatting
+    _substitute(re.compile(r"\{color[^}]*\}.*?\{color\}"), ""),
+    _substitute(re.compile(r"\{\*\}(.*?)\{\*\}"), r"\1"),
+    _substitute(re.compile(r"\{\{([^}]*)\}\}"), r"\1"),
+    _strip_wiki_links,
+    _substitute(re.compile(r"_{color:[^}]*}[^{]*{color}_"), ""),
     # Remove Confluence-style headers like h1. or h2.
-    text = re.sub(r"\bh[1-6]\.\s*", "", text)
+    _substitute(re.compile(r"\bh[1-6]\.\s*"), ""),
+    # Remove table markup: cells, then whole rows
+    _substitute(re.compile(r"\|[^|]*\|"), ""),
+    _strip_table_rows,
+    # Remove bullet characters, markdown-style emphasis, or stray symbols
+    _substitute(re.compile(r"[*#<>\[\]]+"), ""),
+    # Remove placeholder links or mentions like <link to ...>
+    _substitute(re.compile(r"<link[^>]*>"), ""),
+    # Remove extra colons (e.g. "Open questions::")
+    _substitute(re.compile(r"::+"), ":"),
+]
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Typographic characters clean_md_text maps to plain ASCII
+_CLEAN_MD_CHAR_REPLACEMENTS = [
+    ("\u2026", "..."),
+    ("\u00a0", " "),
+    ("\u201c", '"'),
+    ("\u201d", '"'),
+    ("\u2013", "-"),
+    ("\u2014", "-"),
+    ("\u2022", "*"),
+]
 
-    # Remove table markup
-    text = re.sub(r"\|[^|]*\|", "", text)  # Remove table cells
-    text = re.sub(r"^\s*\|.*\|\s*$", "", text, flags=re.MULTILINE)  # Remove table rows
 
-    # Remove bullet characters, markdown-style emphasis, or stray symbols
-    text = re.sub(r"[*#<>\[\]]+", "", text)
+def clean_md_text(text):
+    # Replace escaped characters with spaces
+    if "\\" in text:
+        text = text.replace("\\r\\n", " ").replace("\\n", " ").replace("\\r", " ")
 
-    # Remove placeholder links or mentions like <link to ...>
-    text = re.sub(r"<link[^>]*>", "", text)
+    # Normalize typographic characters; pure ASCII text (checked in O(1))
+    # cannot contain any of them
+    if not text.isascii():
+        for char, replacement in _CLEAN_MD_CHAR_REPLACEMENTS:
+            text = text.replace(char, replacement)
 
-    # Remove extra colons (e.g. "Open questions::")
-    text = re.sub(r"::+", ":", text)
+    # Strip URLs, Jira/Confluence markup, headers, tables and stray symbols
+    for step in _CLEAN_MD_STEPS:
+        text = step(text)
 
     # Collapse multiple spaces and strip
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _WHITESPACE_RE.sub(" ", text).strip()
 
     return text
 
 
+# Wiki-style to markdown conversions applied in order by convert_json_to_markdown
+_WIKI_TO_MARKDOWN_SUBSTITUTIONS = [
+    (re.compile(r"\{\{(.*?)\}\}"), r"`\1`"),  # {{feature}} → `feature`
+    (re.compile(r"\*(.*?)\*"), r"**\1**"),  # *bold* → **bold**
+    (re.compile(r"\[([^\|]+)\|([^\]]+)\]"), r"[\1](\2)"),  # [text|url] → [text](url)
+]
+
+
 def convert_json_to_markdown(data: dict) -> str:
     """
     Convert feature gate correlation data to readable Markdown.
@@ -121,11 +252,8 @@ def convert_json_to_markdown(data: dict) -> str:
 
     def format_description(text):
         # Convert wiki-style formatting to markdown
-        text = re.sub(r"\{\{(.*?)\}\}", r"`\1`", text)  # {{feature}} → `feature`
-        text = re.sub(r"\*(.*?)\*", r"**\1**", text)  # *bold* → **bold**
-        text = re.sub(
-            r"\[([^\|]+)\|([^\]]+)\]", r"[\1](\2)", text
-        )  # [text|url] → [text](url)
+        for pattern, replacement in _WIKI_TO_MARKDOWN_SUBSTITUTIONS:
+            text = pattern.sub(replacement, text)
         return text.strip()
 
     lines = []
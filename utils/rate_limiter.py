@@ -1,7 +1,10 @@
 """Rate limiting functionality for API calls."""
 
+import time
+import asyncio
 import functools
-from typing import Callable, TypeVar, ParamSpec
+import threading
+from typing import Awaitable, Callable, TypeVar, ParamSpec
 from config.settings import AppSettings
 from utils.logging_config import get_logger
 
@@ -10,6 +13,13 @@ logger = get_logger(__name__)
 P = ParamSpec("P")
 T = TypeVar("T")
 
+SECONDS_PER_DAY = 86400
+
+
+def _epoch_day() -> int:
+    """Current UTC day as a day count since the epoch."""
+    return int(time.time() // SECONDS_PER_DAY)
+
 
 class RateLimiter:
     """Manages API rate limiting."""
@@ -19,24 +29,63 @@ class RateLimiter:
         self.settings = settings
         self.max_rpd = settings.api.max_requests_per_day
         self.rpd_counter = 0
+        self._rpd_day = _epoch_day()
+        self._rpd_lock = threading.Lock()
 
-    def check_rate_limit(self, func: Callable[P, T]) -> Callable[P, T]:
+        # Token bucket for requests per minute: holds up to max_rpm tokens and
+        # refills continuously, so bursts pass immediately and sustained load
+        # is spread out instead of being capped by a fixed concurrency
+        self.max_rpm = settings.api.max_requests_per_minute
+        self._tokens = float(self.max_rpm)
+        self._last_refill = time.monotonic()
+        self._bucket_lock = threading.Lock()
+
+    def _reserve(self) -> float:
         """
-        Decorator to check rate limits before executing API calls.
+        Take one token from the bucket.
 
-        Args:
-            func: The function to wrap
+        Returns:
+            Seconds the caller must wait before its request may be sent
+
+        Raises:
+            ValueError: If the per-minute limit is not positive
+        """
+        if self.max_rpm <= 0:
+            raise ValueError("Maximum requests per minute must be positive")
+
+        refill_rate = self.max_rpm / 60.0
+        with self._bucket_lock:
+            now = time.monotonic()
+            self._tokens = min(
+                float(self.max_rpm),
+                self._tokens + (now - self._last_refill) * refill_rate,
+            )
+            self._last_refill = now
+            # A negative balance queues the caller behind earlier reservations
+            self._tokens -= 1
+            return max(0.0, -self._tokens / refill_rate)
+
+    def _acquire_daily_request(self) -> int:
+        """
+        Reserve one request from the daily budget.
+
+        The rollover, the limit check and the increment happen under one
+        lock, so concurrent callers can never reserve more than the budget.
 
         Returns:
-            Wrapped function that checks rate limits
+            The day the request was counted against
 
         Raises:
             RuntimeError: If API rate limit is exceeded
             ValueError: If rate limit counters are invalid
         """
+        with self._rpd_lock:
+            # Start a new daily budget when the UTC day rolls over
+            today = _epoch_day()
+            if today != self._rpd_day:
+                self.rpd_counter = 0
+                self._rpd_day = today
 
-        @functools.wraps(func)
-        def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
             # Validate counter values
             if self.rpd_counter < 0:
                 raise ValueError("Request counter cannot be negative")
@@ -50,15 +99,85 @@ class RateLimiter:
                 )
                 raise RuntimeError("Daily API request limit exceeded")
 
+            self.rpd_counter += 1
+            return today
+
+    def _release_daily_request(self, day: int) -> None:
+        """Give back a reserved request whose call failed."""
+        with self._rpd_lock:
+            # A reservation from before a rollover no longer holds a slot
+            if day == self._rpd_day:
+                self.rpd_counter -= 1
+
+    def _log_success(self) -> None:
+        """Log the remaining daily budget after a successful request."""
+        logger.debug(
+            f"API request successful. Requests remaining: {self.max_rpd - self.rpd_counter}"
+        )
+
+    def check_rate_limit(self, func: Callable[P, T]) -> Callable[P, T]:
+        """
+        Decorator to check rate limits before executing API calls.
+
+        Args:
+            func: The function to wrap
+
+        Returns:
+            Wrapped function that checks rate limits
+
+        Raises:
+            RuntimeError: If API rate limit is exceeded
+            ValueError: If rate limit counters are invalid
+        """
+
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            day = self._acquire_daily_request()
             try:
+                if delay := self._reserve():
+                    time.sleep(delay)
                 result = func(*args, **kwargs)
-                self.rpd_counter += 1
-                logger.debug(
-                    f"API request successful. Requests remaining: {self.max_rpd - self.rpd_counter}"
-                )
-                return result
             except Exception as e:
+                self._release_daily_request(day)
+                logger.error(f"API request failed: {str(e)}")
+                raise
+            self._log_success()
+            return result
+
+        return wrapper
+
+    def check_rate_limit_async(
+        self, func: Callable[P, Awaitable[T]]
+    ) -> Callable[P, Awaitable[T]]:
+        """
+        Async variant of check_rate_limit for coroutine functions.
+
+        Waiting for a token yields to the event loop, so other coroutines
+        keep running while this one is throttled.
+
+        Args:
+            func: The coroutine function to wrap
+
+        Returns:
+            Wrapped coroutine function that checks rate limits
+
+        Raises:
+            RuntimeError: If API rate limit is exceeded
+            ValueError: If rate limit counters are invalid
+        """
+
+        @functools.wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            day = self._acquire_daily_request()
+            try:
+                if delay := self._reserve():
+                    await asyncio.sleep(delay)
+                result = await func(*args, **kwargs)
+            except Exception as e:
+                self._release_daily_request(day)
                 logger.error(f"API request failed: {str(e)}")
                 raise
+            self._log_success()
+            return result
 
         return wrapper
@@ -1,43 +1,109 @@
+import os
 import re
-import json
-from typing import Callable, Dict, List, Any, Optional
+import asyncio
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Awaitable, Callable, Dict, List, Any, Optional, Tuple, TypeVar
 from urllib.parse import urlparse
 from pathlib import Path
 from utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
-ALLOWED_PROTOCOLS = ("http", "https")
+ALLOWED_PROTOCOLS = frozenset({"http", "https"})
 
-# Keyword lists for content classification and filtering
+# Plain lowercase http(s) URL with an ASCII host; anything else (uppercase
+# schemes, whitespace, brackets, non-ASCII hosts) is left to urlparse
+_SIMPLE_URL_RE = re.compile(r"https?://[A-Za-z0-9.\-:@%_~!$&'()*+,;=]+(?:[/?#]|\Z)")
+
+T = TypeVar("T")
+
+# Keyword sets for content classification and filtering
 # These are used to determine if content represents new features vs. bug fixes
 
 # Keywords that typically indicate maintenance work rather than new features
-NON_FEATURE_KEYWORDS = [
-    "bug",
-    "fix",
-    "error",
-    "typo",
-    "crash",
-    "broken",
-    "regression",
-    "refactor",
-    "test",
-    "qa",
-    "chore",
-]
+NON_FEATURE_KEYWORDS = frozenset(
+    {
+        "bug",
+        "fix",
+        "error",
+        "typo",
+        "crash",
+        "broken",
+        "regression",
+        "refactor",
+        "test",
+        "qa",
+        "chore",
+    }
+)
 
 # Keywords that typically indicate new feature development
-FEATURE_KEYWORDS = [
-    "feature",
-    "add",
-    "new",
-    "enhancement",
-    "implement",
-    "introduce",
-    "support",
-    "improve",
-]
+FEATURE_KEYWORDS = frozenset(
+    {
+        "feature",
+        "add",
+        "new",
+        "enhancement",
+        "implement",
+        "introduce",
+        "support",
+        "improve",
+    }
+)
+
+
+def run_async(coro: Awaitable[T], max_workers: int) -> T:
+    """
+    Run a coroutine to completion from synchronous code.
+
+    Blocking work inside the coroutine is expected to go through
+    asyncio.to_thread. Each call creates its own ThreadPoolExecutor of
+    max_workers threads and installs it as the loop's default executor, so
+    that work stays bounded instead of growing with the CPU count. The
+    executor belongs to that call's event loop: asyncio.run shuts it down
+    when the coroutine finishes, so nothing outlives the call.
+
+    When called from inside a running event loop (an async caller or a
+    notebook), asyncio.run cannot start a second loop on the same thread, so
+    the coroutine runs on a fresh loop in a worker thread instead. The
+    caller is blocked until it finishes, just as it would be by synchronous
+    code; async callers should await the coroutine directly instead.
+
+    Args:
+        coro: Coroutine to run
+        max_workers: Maximum number of worker threads for asyncio.to_thread
+
+    Returns:
+        The coroutine's result
+    """
+
+    async def runner() -> T:
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=max_workers)
+        )
+        return await coro
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(runner())
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, runner()).result()
+
+
+@lru_cache(maxsize=4096)
+def _is_allowed_url(url: str) -> bool:
+    """Whether url parses as an allowed-protocol URL with a host."""
+    if _SIMPLE_URL_RE.match(url):
+        return True
+    try:
+        result = urlparse(url)
+    except ValueError:
+        return False
+    return result.scheme in ALLOWED_PROTOCOLS and bool(result.netloc)
 
 
 def is_valid_url(url):
@@ -49,21 +115,34 @@ def is_valid_url(url):
     Also accepts local file paths.
 
     Args:
-        url: URL string to validate
+        url: URL string or local file path (str or Path) to validate
 
     Returns:
         Boolean indicating if URL is valid and safe to use
     """
-    # Check if it's a local file
-    if Path(url).is_file():
+    url = os.fspath(url)
+
+    # Check if it's a valid URL first; almost every input is one, and this
+    # avoids a filesystem stat for each of them
+    if _is_allowed_url(url):
         return True
 
-    # Check if it's a valid URL
-    try:
-        result = urlparse(url)
-        return all([result.scheme in ALLOWED_PROTOCOLS, result.netloc])
-    except ValueError:
-        return False
+    # Otherwise check if it's a local file (not cached, files come and go)
+    return Path(url).is_file()
+
+
+@lru_cache(maxsize=32)
+def _keyword_pattern(keywords: Tuple[str, ...]) -> Optional[re.Pattern]:
+    """Compile keywords, lower-cased, into one alternation so each field is scanned once."""
+    if not keywords:
+        return None
+    # Callers only test whether any keyword occurs, so the order cannot change
+    # a result; longest first (ties alphabetical) keeps the pattern the same
+    # on every run, with no keyword ahead of a longer one it is a prefix of
+    alternatives = sorted(
+        {kw.lower() for kw in keywords}, key=lambda kw: (-len(kw), kw)
+    )
+    return re.compile("|".join(re.escape(kw) for kw in alternatives))
 
 
 def contains_valid_keywords(fields, invalid_keywords: List[str]) -> bool:
@@ -80,13 +159,15 @@ def contains_valid_keywords(fields, invalid_keywords: List[str]) -> bool:
     Returns:
         Boolean indicating if content passes keyword validation (True = valid)
     """
-    invalid_keywords = [kw.lower() for kw in invalid_keywords]
+    # Keyed on the keywords as given, so lower-casing happens once per list
+    pattern = _keyword_pattern(tuple(invalid_keywords))
+    if pattern is None:
+        return True
     for field in fields:
         if field is None or not isinstance(field, str):
             continue
-        field_str = field.lower()
         # If any invalid keyword is found, reject the content
-        if any(keyword in field_str for keyword in invalid_keywords):
+        if pattern.search(field.lower()):
             return False
     return True
 
@@ -118,23 +199,27 @@ def get_urls(
     else:
         file_path = urls_file_path
 
-    if not file_path.is_file():
+    try:
+        text = file_path.read_text()
+    except FileNotFoundError:
         logger.error(f"[!][ERROR] URL file {file_path} not found for source: {src}")
         return []
-
-    try:
-        with open(file_path, "r") as f:
-            # Filter out empty lines and strip whitespace
-            return [line.strip() for line in f if line.strip()]
     except IOError as e:
         logger.error(f"[!][ERROR] Failed to read URL file: {e}")
         return []
 
+    # Filter out empty lines and strip whitespace, stripping each line once
+    return [url for line in text.split("\n") if (url := line.strip())]
+
 
-def add_urls_to_file(urls: list[str], file_path: str, mode: str = "a"):
+def add_urls_to_file(urls: list[str], file_path: str | Path, mode: str = "a"):
     with open(file_path, mode) as f:
-        for url in urls:
-            f.write(url + "\n")
+        # One write of the joined lines instead of one per URL
+        if urls:
+            f.write("\n".join(urls) + "\n")
+
+
+_JIRA_KEY_PREFIX_RE = re.compile(r"\b([A-Z][A-Z0-9]+-\d+)\b")
 
 
 def json_to_markdown(data, heading_level=1, jira_server=None):
@@ -146,7 +231,7 @@ def json_to_markdown(data, heading_level=1, jira_server=None):
     and structured presentation of data.
 
     Args:
-        data: JSON data (dict, list, or JSON string) to convert
+        data: JSON data (dict, list, or JSON str/bytes) to convert
         heading_level: Starting heading level for hierarchical structure
         jira_server: Optional JIRA server URL for creating issue links
 
@@ -160,54 +245,56 @@ def json_to_markdown(data, heading_level=1, jira_server=None):
     - Handles both objects and arrays appropriately
     - Creates clickable JIRA links when jira_server is provided
     """
-    if isinstance(data, str):
-        data = json.loads(data)
+    if isinstance(data, (str, bytes)):
+        data = orjson.loads(data)
 
     def create_jira_link(text):
         """Create a clickable JIRA link if the text matches a JIRA issue pattern."""
         if not jira_server:
             return text
-        match = re.match(r"\b([A-Z][A-Z0-9]+-\d+)\b", text)
+        match = _JIRA_KEY_PREFIX_RE.match(text)
         if match:
             issue_key = match.group(1)
             return f"[{issue_key}]({jira_server}/browse/{issue_key})"
         return text
 
-    markdown = ""
-    if isinstance(data, dict):
-        for key, value in data.items():
-            if isinstance(value, (dict, list)):
-                # Create heading for complex nested structures
-                markdown += f"{'#' * heading_level} {key.capitalize()}\n\n"
-                markdown += json_to_markdown(value, heading_level + 1, jira_server)
-            else:
-                # Format simple key-value pairs as bold key with value
-                if key == "epic_key" and jira_server:
-                    # Special handling for epic_key to create a link
-                    markdown += (
+    # Every level appends to one shared buffer that is joined once at the end,
+    # instead of each recursive call returning a string for its parent to copy
+    parts: List[str] = []
+
+    def render(data, heading_level):
+        if isinstance(data, dict):
+            heading = "#" * heading_level
+            for key, value in data.items():
+                if isinstance(value, (dict, list)):
+                    # Create heading for complex nested structures
+                    parts.append(f"{heading} {key.capitalize()}\n\n")
+                    render(value, heading_level + 1)
+                else:
+                    # Format simple key-value pairs as bold key with value
+                    # (epic_key and any other value containing a JIRA key is linked)
+                    parts.append(
                         f"**{key.capitalize()}:** {create_jira_link(str(value))}\n\n"
                     )
+        elif isinstance(data, list):
+            for idx, item in enumerate(data, 1):
+                if isinstance(item, (dict, list)):
+                    # Recursively process complex list items
+                    render(item, heading_level)
                 else:
-                    # For other fields, check if the value contains a JIRA key
-                    value_str = str(value)
-                    markdown += (
-                        f"**{key.capitalize()}:** {create_jira_link(value_str)}\n\n"
-                    )
-    elif isinstance(data, list):
-        for idx, item in enumerate(data, 1):
-            if isinstance(item, (dict, list)):
-                # Recursively process complex list items
-                markdown += json_to_markdown(item, heading_level, jira_server)
-            else:
-                # Format simple list items as numbered list and check for JIRA keys
-                markdown += f"{idx}. {create_jira_link(str(item))}\n"
-    return markdown
+                    # Format simple list items as numbered list and check for JIRA keys
+                    parts.append(f"{idx}. {create_jira_link(str(item))}\n")
+
+    render(data, heading_level)
+    return "".join(parts)
+
+
+# Matches URLs (http, https, www)
+_URL_RE = re.compile(r"(https?://\S+|www\.\S+)")
 
 
 def remove_urls(text):
-    # Regex pattern to match URLs (http, https, www)
-    url_pattern = r"(https?://\S+|www\.\S+)"
-    return re.sub(url_pattern, "", text)
+    return _URL_RE.sub("", text)
 
 
 def strings_to_list(s: str) -> list:
@@ -215,6 +302,10 @@ def strings_to_list(s: str) -> list:
     return [item.strip() for item in s.split(",")]
 
 
+# Control characters other than tab, line feed and carriage return
+_CONTROL_CHAR_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
 def validate_cs_input_str(input_str: str, field_name: str) -> list[str]:
     """Validate and parse comma-separated input string.
 
@@ -231,15 +322,15 @@ def validate_cs_input_str(input_str: str, field_name: str) -> list[str]:
     if not input_str or not input_str.strip():
         return []
 
+    # strings_to_list has already stripped each item
     items = strings_to_list(input_str)
     validated_items = []
 
     for item in items:
-        item = item.strip()
         if not item:
             continue
         # Basic validation - no control characters
-        if any(ord(c) < 32 for c in item if c not in "\t\n\r"):
+        if _CONTROL_CHAR_RE.search(item):
             raise ValueError(
                 f"Invalid {field_name} contains control characters: {item}"
             )
@@ -259,6 +350,10 @@ def split_dict(dictionary: dict) -> tuple[dict, dict]:
     return first_half, second_half
 
 
+# Matches JIRA IDs: UPPERCASE-NUMBERS (e.g., CONSOLE-4661, AGENT-1262)
+_JIRA_ID_RE = re.compile(r"[A-Z]+-\d+")
+
+
 def convert_jira_ids_to_links(content: str, jira_server: str) -> str:
     """
     Convert JIRA IDs to hyperlinks in a markdown file.
@@ -270,12 +365,10 @@ def convert_jira_ids_to_links(content: str, jira_server: str) -> str:
     Returns:
         str: The content with JIRA IDs converted to hyperlinks
     """
-    # Pattern matches: UPPERCASE-NUMBERS (e.g., CONSOLE-4661, AGENT-1262)
-    pattern = r"[A-Z]+-\d+"
 
     def replace_match(match: re.Match) -> str:
         """Convert a single JIRA ID match to a hyperlink."""
         jira_id = match.group()
         return f"[{jira_id}]({jira_server}/browse/{jira_id})"
 
-    return re.sub(pattern, replace_match, content)
+    return _JIRA_ID_RE.sub(replace_match, content)